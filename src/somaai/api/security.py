@@ -8,31 +8,75 @@ Provides:
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import logging
+import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict
 from functools import wraps
 from typing import Callable
 
 from fastapi import Depends, HTTPException, Request, Security
 from fastapi.security import APIKeyHeader
 
+from somaai.settings import settings
+from somaai.utils.ids import generate_short_id
+
+logger = logging.getLogger(__name__)
+
 # API key header
 API_KEY_HEADER = APIKeyHeader(name="X-API-Key", auto_error=False)
 
+# Captured once at import; auth mode does not change at runtime
+_REQUIRE_API_KEY = settings.require_api_key
+
+
+# (prev_count, curr_count, curr_window_index, expires_at)
+_ClientState = tuple[int, int, int, float]
+# Per-shard client state with the lock guarding it
+_Shard = tuple[OrderedDict[str, _ClientState], threading.Lock]
+
 
 class RateLimiter:
     """In-memory rate limiter for API endpoints.
 
-    Uses sliding window algorithm for accurate rate limiting.
-    For production, consider Redis-based implementation.
+    Uses the sliding window counter algorithm: each client keeps the
+    counts of the previous and current fixed windows, and the request
+    rate is estimated by weighting the previous count by how much of it
+    still overlaps the sliding window. O(1) state and work per request.
+    Used directly in development and as the fallback for RedisRateLimiter.
+
+    Client state is held in a bounded LRU: entries expire once their
+    windows no longer affect the estimate, and the least recently
+    admitted client is evicted when ``max_clients`` is reached.
+
+    State is split into shards keyed by client, each guarded by its own
+    lock, so concurrent threads (e.g. free-threaded CPython) only
+    contend when they hit the same shard.
     """
 
-    def __init__(self):
-        """Initialize rate limiter."""
-        # {client_id: [(timestamp, count), ...]}
-        self._requests: dict[str, list[tuple[float, int]]] = defaultdict(list)
-        self._window_size = 60  # 1 minute window
+    def __init__(self, max_clients: int = 100_000, shards: int = 16):
+        """Initialize rate limiter.
+
+        Args:
+            max_clients: Maximum number of clients tracked at once
+            shards: Number of independently locked shards; the LRU
+                bound applies per shard (max_clients / shards each)
+        """
+        self.max_clients = max_clients
+        self._shard_capacity = max(1, max_clients // shards)
+        self._shards: list[_Shard] = [
+            (OrderedDict(), threading.Lock()) for _ in range(shards)
+        ]
+
+    def __len__(self) -> int:
+        """Number of clients currently tracked."""
+        return sum(len(counters) for counters, _ in self._shards)
+
+    def _shard(self, client_id: str) -> _Shard:
+        """Get the shard holding a client's state."""
+        return self._shards[hash(client_id) % len(self._shards)]
 
     def is_allowed(
         self,
@@ -50,29 +94,61 @@ class RateLimiter:
         Returns:
             Tuple of (is_allowed, remaining_requests)
         """
+        counters, lock = self._shard(client_id)
         now = time.time()
-        window_start = now - window_seconds
+        window = int(now // window_seconds)
 
-        # Clean old entries
-        self._requests[client_id] = [
-            (ts, count) for ts, count in self._requests[client_id]
-            if ts > window_start
-        ]
+        with lock:
+            prev_count, curr_count, curr_window, _ = counters.get(
+                client_id, (0, 0, window, 0.0)
+            )
+
+            # Rotate windows
+            if curr_window == window - 1:
+                prev_count, curr_count = curr_count, 0
+            elif curr_window != window:
+                prev_count, curr_count = 0, 0
 
-        # Count requests in window
-        total = sum(count for _, count in self._requests[client_id])
+            elapsed = now - window * window_seconds
+            estimate = prev_count * (1 - elapsed / window_seconds) + curr_count
 
-        if total >= limit:
-            return False, 0
+            if estimate >= limit:
+                return False, 0
 
-        # Record this request
-        self._requests[client_id].append((now, 1))
+            # State is irrelevant once the next window has fully passed
+            expires_at = (window + 2) * window_seconds
+            counters[client_id] = (prev_count, curr_count + 1, window, expires_at)
+            counters.move_to_end(client_id)
+            while len(counters) > self._shard_capacity:
+                counters.popitem(last=False)
 
-        return True, limit - total - 1
+        return True, max(0, int(limit - estimate - 1))
+
+    def expire(self) -> int:
+        """Drop state for clients whose windows have elapsed.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        removed = 0
+        for counters, lock in self._shards:
+            with lock:
+                expired = [
+                    client_id
+                    for client_id, (_, _, _, expires_at) in counters.items()
+                    if expires_at <= now
+                ]
+                for client_id in expired:
+                    del counters[client_id]
+            removed += len(expired)
+        return removed
 
     def reset(self, client_id: str) -> None:
         """Reset rate limit for a client."""
-        self._requests.pop(client_id, None)
+        counters, lock = self._shard(client_id)
+        with lock:
+            counters.pop(client_id, None)
 
 
 # Global rate limiter instance
@@ -84,6 +160,128 @@ def get_rate_limiter() -> RateLimiter:
     return _rate_limiter
 
 
+async def run_rate_limiter_janitor(interval: float = 60.0) -> None:
+    """Periodically expire idle rate limiter entries.
+
+    Eviction in is_allowed only happens on admission, so idle clients
+    would otherwise linger until pushed out by the LRU bound.
+    Run as a background task for the lifetime of the app.
+
+    Args:
+        interval: Seconds between sweeps
+    """
+    while True:
+        await asyncio.sleep(interval)
+        removed = _rate_limiter.expire()
+        if removed:
+            logger.debug(f"Expired {removed} rate limiter entries")
+
+
+# Sliding-log check in one atomic round-trip.
+# KEYS[1]: client key
+# ARGV: now_ms, window_seconds, limit, unique member
+_SLIDING_LOG_LUA = """
+local now = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2]) * 1000
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window_ms)
+local count = redis.call('ZCARD', KEYS[1])
+if count >= limit then
+    return {0, 0}
+end
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('PEXPIRE', KEYS[1], window_ms)
+return {1, limit - count - 1}
+"""
+
+
+class RedisRateLimiter:
+    """Redis-backed rate limiter shared across workers.
+
+    Runs the whole check as a single Lua script, so it is atomic and
+    costs one round-trip. Falls back to the in-memory limiter when
+    Redis is unreachable, and skips Redis for RETRY_AFTER_FAILURE
+    seconds after a failure instead of retrying on every request.
+    """
+
+    NAMESPACE = "somaai:ratelimit"
+    RETRY_AFTER_FAILURE = 30.0
+
+    def __init__(self, fallback: RateLimiter | None = None):
+        """Initialize rate limiter.
+
+        Args:
+            fallback: In-memory limiter used when Redis is unavailable
+        """
+        self._fallback = fallback or RateLimiter()
+        self._script = None
+        self._redis_down_until = 0.0
+
+    async def _get_script(self):
+        """Register the Lua script lazily."""
+        if self._script is None:
+            from somaai.utils.redis import get_ratelimit_redis
+
+            redis = await get_ratelimit_redis()
+            self._script = redis.register_script(_SLIDING_LOG_LUA)
+        return self._script
+
+    async def is_allowed(
+        self,
+        client_id: str,
+        limit: int,
+        window_seconds: int = 60,
+    ) -> tuple[bool, int]:
+        """Check if request is allowed under rate limit.
+
+        Args:
+            client_id: Unique client identifier (IP or API key hash)
+            limit: Maximum requests per window
+            window_seconds: Window size in seconds
+
+        Returns:
+            Tuple of (is_allowed, remaining_requests)
+        """
+        if time.monotonic() < self._redis_down_until:
+            return self._fallback.is_allowed(client_id, limit, window_seconds)
+
+        try:
+            script = await self._get_script()
+            now_ms = int(time.time() * 1000)
+            allowed, remaining = await script(
+                keys=[f"{self.NAMESPACE}:{client_id}"],
+                args=[now_ms, window_seconds, limit, f"{now_ms}-{generate_short_id()}"],
+            )
+            return bool(allowed), int(remaining)
+        except Exception as e:
+            self._redis_down_until = time.monotonic() + self.RETRY_AFTER_FAILURE
+            logger.warning(
+                f"Redis rate limit failed, using in-memory fallback for "
+                f"{self.RETRY_AFTER_FAILURE:.0f}s: {e}"
+            )
+            return self._fallback.is_allowed(client_id, limit, window_seconds)
+
+    async def reset(self, client_id: str) -> None:
+        """Reset rate limit for a client."""
+        self._fallback.reset(client_id)
+        try:
+            from somaai.utils.redis import get_ratelimit_redis
+
+            redis = await get_ratelimit_redis()
+            await redis.delete(f"{self.NAMESPACE}:{client_id}")
+        except Exception as e:
+            logger.warning(f"Redis rate limit reset failed: {e}")
+
+
+# Global Redis-backed rate limiter instance
+_redis_rate_limiter = RedisRateLimiter(fallback=_rate_limiter)
+
+
+def get_redis_rate_limiter() -> RedisRateLimiter:
+    """Get the global Redis-backed rate limiter instance."""
+    return _redis_rate_limiter
+
+
 class APIKeyAuth:
     """API key authentication handler.
 
@@ -92,8 +290,9 @@ class APIKeyAuth:
 
     def __init__(self):
         """Initialize auth handler."""
-        self._valid_keys: set[str] = set()
-        self._key_metadata: dict[str, dict] = {}
+        # Raw 32-byte SHA-256 digests; no hex encoding on the lookup path
+        self._valid_keys: set[bytes] = set()
+        self._key_metadata: dict[bytes, dict] = {}
 
     def add_key(self, key: str, metadata: dict | None = None) -> None:
         """Add a valid API key.
@@ -119,15 +318,43 @@ class APIKeyAuth:
         if not key:
             return None
 
-        key_hash = self._hash_key(key)
+        return self.validate_key_hash(self._hash_key(key))
+
+    def validate_key_hash(self, key_hash: bytes) -> dict | None:
+        """Validate an already-hashed API key.
+
+        Args:
+            key_hash: Hash of the API key (see hash_api_key)
+
+        Returns:
+            Key metadata if valid, None if invalid
+        """
         if key_hash in self._valid_keys:
             return self._key_metadata.get(key_hash, {"valid": True})
 
         return None
 
-    def _hash_key(self, key: str) -> str:
+    def _hash_key(self, key: str) -> bytes:
         """Hash an API key for storage."""
-        return hashlib.sha256(key.encode()).hexdigest()
+        return hash_api_key(key)
+
+
+def hash_api_key(key: str) -> bytes:
+    """Hash an API key (raw SHA-256 digest)."""
+    return hashlib.sha256(key.encode()).digest()
+
+
+def get_api_key_hash(request: Request, api_key: str) -> bytes:
+    """Get the hash of the request's API key.
+
+    Computed once per request and cached on ``request.state`` so that
+    client identification and key validation share a single hash.
+    """
+    key_hash = getattr(request.state, "api_key_hash", None)
+    if key_hash is None:
+        key_hash = hash_api_key(api_key)
+        request.state.api_key_hash = key_hash
+    return key_hash
 
 
 # Global auth instance
@@ -146,7 +373,7 @@ def get_client_id(request: Request) -> str:
     """
     api_key = request.headers.get("X-API-Key")
     if api_key:
-        return f"key:{hashlib.sha256(api_key.encode()).hexdigest()[:16]}"
+        return f"key:{get_api_key_hash(request, api_key)[:8].hex()}"
     
     # Fall back to IP
     forwarded = request.headers.get("X-Forwarded-For")
@@ -174,10 +401,8 @@ async def verify_api_key(
     Raises:
         HTTPException: If key is missing or invalid
     """
-    from somaai.settings import settings
-
     # Skip auth if disabled (development mode)
-    if not settings.require_api_key:
+    if not _REQUIRE_API_KEY:
         return {"user": "anonymous", "authenticated": False}
 
     if not api_key:
@@ -186,8 +411,12 @@ async def verify_api_key(
             detail="API key required. Include X-API-Key header.",
         )
 
-    auth = get_api_key_auth()
-    metadata = auth.validate_key(api_key)
+    return _validate_api_key(request, api_key)
+
+
+def _validate_api_key(request: Request, api_key: str) -> dict:
+    """Validate a present API key or raise 401."""
+    metadata = _api_key_auth.validate_key_hash(get_api_key_hash(request, api_key))
 
     if not metadata:
         raise HTTPException(
@@ -213,30 +442,28 @@ def rate_limit(
     Returns:
         Decorator function
     """
+    # Bound once at decoration time rather than on every request
+    limiter = get_redis_rate_limiter()
+    detail = f"Rate limit exceeded. Try again in {window_seconds} seconds."
+    headers = {
+        "Retry-After": str(window_seconds),
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": "0",
+    }
+
     def decorator(func: Callable):
+        if settings.rate_limit_disabled:
+            return func
+
         @wraps(func)
         async def wrapper(request: Request, *args, **kwargs):
-            client_id = key_func(request)
-            limiter = get_rate_limiter()
-
-            allowed, remaining = limiter.is_allowed(
-                client_id, limit, window_seconds
+            allowed, _ = await limiter.is_allowed(
+                key_func(request), limit, window_seconds
             )
-
             if not allowed:
-                raise HTTPException(
-                    status_code=429,
-                    detail=f"Rate limit exceeded. Try again in {window_seconds} seconds.",
-                    headers={
-                        "Retry-After": str(window_seconds),
-                        "X-RateLimit-Limit": str(limit),
-                        "X-RateLimit-Remaining": "0",
-                    },
-                )
-
-            # Add rate limit headers to response
-            response = await func(request, *args, **kwargs)
-            return response
+                raise HTTPException(status_code=429, detail=detail, headers=headers)
+
+            return await func(request, *args, **kwargs)
 
         return wrapper
     return decorator
@@ -258,9 +485,9 @@ async def check_rate_limit(
         HTTPException: If rate limit exceeded
     """
     client_id = get_client_id(request)
-    limiter = get_rate_limiter()
+    limiter = get_redis_rate_limiter()
 
-    allowed, remaining = limiter.is_allowed(client_id, limit, window_seconds)
+    allowed, remaining = await limiter.is_allowed(client_id, limit, window_seconds)
 
     if not allowed:
         raise HTTPException(
@@ -44,6 +44,22 @@ async def ask_question(data: ChatRequest):
     pass
 
 
+@router.post("/ask_batch", response_model=list[ChatResponse])
+async def ask_questions_batch(data: list[ChatRequest]):
+    """Ask several questions in one request.
+
+    Questions sharing a grade and subject are retrieved together with a
+    single batched vector search, instead of one search per question.
+
+    Request body:
+    - List of ChatRequest objects (same fields as /ask)
+
+    Response:
+    - List of ChatResponse objects, in request order
+    """
+    pass
+
+
 @router.get("/messages/{message_id}", response_model=MessageResponse)
 async def get_message(message_id: str):
     """Get a specific message by ID.
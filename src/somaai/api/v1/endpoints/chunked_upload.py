@@ -2,13 +2,18 @@
 
 Supports uploading files larger than 50MB by splitting into chunks.
 Uses Redis for session state to support horizontal scaling.
-Uses aiofiles for efficient async file I/O.
+Uses aiofiles for efficient async file I/O; reassembly copies chunks
+in-kernel in a worker thread.
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
+import heapq
 import logging
+import os
+import shutil
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -16,6 +21,13 @@ from fastapi import APIRouter, HTTPException, UploadFile, File
 
 from somaai.utils.ids import generate_id
 
+try:
+    import aiofiles
+    import aiofiles.os as aio_os
+    _HAS_AIOFILES = True
+except ImportError:
+    _HAS_AIOFILES = False
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/upload", tags=["upload"])
@@ -24,6 +36,14 @@ router = APIRouter(prefix="/upload", tags=["upload"])
 CHUNK_DIR = Path("/tmp/somaai_uploads")
 CHUNK_DIR.mkdir(exist_ok=True)
 
+# Read size when streaming an incoming chunk to disk
+STREAM_READ_SIZE = 64 * 1024
+
+# Copy buffer size for the buffered fallback
+COPY_BUFFER_SIZE = 256 * 1024
+# Max bytes per copy_file_range/sendfile call (covers a 5MB chunk)
+KERNEL_COPY_SIZE = 8 * 1024 * 1024
+
 # Session TTL (2 hours)
 SESSION_TTL = 7200
 NAMESPACE = "somaai:upload"
@@ -36,40 +56,178 @@ async def _get_redis():
 
 
 def _session_key(upload_id: str) -> str:
-    """Generate Redis key for upload session."""
+    """Generate Redis key for upload session hash."""
     return f"{NAMESPACE}:session:{upload_id}"
 
 
+def _received_key(upload_id: str) -> str:
+    """Generate Redis key for the set of received chunk indices."""
+    return f"{NAMESPACE}:received:{upload_id}"
+
+
 async def _get_session(upload_id: str) -> dict | None:
-    """Get upload session from Redis."""
+    """Get upload session fields from Redis."""
     try:
         redis = await _get_redis()
-        data = await redis.get(_session_key(upload_id))
+        data = await redis.hgetall(_session_key(upload_id))
         if data:
-            return json.loads(data)
+            data["total_size"] = int(data["total_size"])
+            data["total_chunks"] = int(data["total_chunks"])
+            return data
     except Exception as e:
         logger.warning(f"Redis get failed, using fallback: {e}")
     return None
 
 
 async def _save_session(upload_id: str, session: dict) -> None:
-    """Save upload session to Redis."""
+    """Save upload session fields to Redis."""
     try:
         redis = await _get_redis()
-        await redis.setex(
-            _session_key(upload_id),
-            SESSION_TTL,
-            json.dumps(session),
-        )
+        pipe = redis.pipeline(transaction=False)
+        pipe.hset(_session_key(upload_id), mapping=session)
+        pipe.expire(_session_key(upload_id), SESSION_TTL)
+        await pipe.execute()
     except Exception as e:
         logger.warning(f"Redis save failed: {e}")
 
 
+async def _mark_chunk_received(upload_id: str, chunk_index: int) -> int:
+    """Record a received chunk.
+
+    Also refreshes the session TTL, so active uploads don't expire.
+
+    Args:
+        upload_id: Upload session ID
+        chunk_index: Zero-based chunk index
+
+    Returns:
+        Number of distinct chunks received so far
+
+    Raises:
+        HTTPException: If the chunk could not be recorded in Redis
+    """
+    try:
+        redis = await _get_redis()
+        key = _received_key(upload_id)
+        pipe = redis.pipeline(transaction=False)
+        pipe.sadd(key, chunk_index)
+        pipe.scard(key)
+        pipe.expire(key, SESSION_TTL)
+        pipe.expire(_session_key(upload_id), SESSION_TTL)
+        _, received_count, *_ = await pipe.execute()
+        return received_count
+    except Exception as e:
+        logger.warning(f"Redis chunk record failed: {e}")
+        # The chunk file is on disk; re-sending the chunk is safe
+        raise HTTPException(
+            status_code=503,
+            detail=f"Chunk {chunk_index} could not be recorded, please retry",
+        )
+
+
+async def _get_received_chunks(upload_id: str) -> set[int]:
+    """Get the indices of all received chunks."""
+    redis = await _get_redis()
+    members = await redis.smembers(_received_key(upload_id))
+    return {int(m) for m in members}
+
+
+async def _stream_to_file(upload: UploadFile, path: Path) -> tuple[int, str]:
+    """Stream an uploaded file to disk in STREAM_READ_SIZE slices.
+
+    Args:
+        upload: Incoming upload
+        path: Destination file path
+
+    Returns:
+        Tuple of (bytes written, BLAKE2b hex digest)
+    """
+    size = 0
+    hasher = hashlib.blake2b()
+    if _HAS_AIOFILES:
+        async with aiofiles.open(path, "wb") as f:
+            while buf := await upload.read(STREAM_READ_SIZE):
+                await f.write(buf)
+                hasher.update(buf)
+                size += len(buf)
+    else:
+        with open(path, "wb") as f:
+            while buf := await upload.read(STREAM_READ_SIZE):
+                f.write(buf)
+                hasher.update(buf)
+                size += len(buf)
+    return size, hasher.hexdigest()
+
+
+def _list_chunks(session_dir: Path) -> list[str]:
+    """List chunk file paths in a session directory, ordered by index.
+
+    Args:
+        session_dir: Upload session directory
+
+    Returns:
+        Chunk file paths sorted by their numeric chunk index
+    """
+    try:
+        with os.scandir(session_dir) as it:
+            entries = [e for e in it if e.name.startswith("chunk_")]
+    except FileNotFoundError:
+        return []
+    entries.sort(key=lambda e: int(e.name[6:]))
+    return [e.path for e in entries]
+
+
+def _reassemble_chunks(chunks: list[str], final_path: Path) -> None:
+    """Concatenate chunk files into final_path without buffering them.
+
+    Copies inside the kernel (copy_file_range or sendfile) so data never
+    passes through user space; falls back to shutil.copyfileobj with a
+    bounded buffer where neither is available. Blocking; run it in a
+    thread.
+
+    Args:
+        chunks: Chunk file paths in order
+        final_path: Destination file path
+    """
+    use_kernel_copy = hasattr(os, "copy_file_range") or hasattr(os, "sendfile")
+    with open(final_path, "wb") as out:
+        for chunk_path in chunks:
+            with open(chunk_path, "rb") as inp:
+                if use_kernel_copy:
+                    offset = out.tell()
+                    try:
+                        _kernel_copy(inp.fileno(), out.fileno())
+                        out.seek(0, os.SEEK_END)
+                        continue
+                    except OSError:
+                        # Filesystem doesn't support it; redo this chunk buffered
+                        use_kernel_copy = False
+                        out.seek(offset)
+                        out.truncate()
+                        inp.seek(0)
+                shutil.copyfileobj(inp, out, length=COPY_BUFFER_SIZE)
+
+
+def _kernel_copy(in_fd: int, out_fd: int) -> None:
+    """Copy in_fd to out_fd inside the kernel until EOF.
+
+    Prefers copy_file_range (Linux), which copies a whole chunk in one
+    call and can share extents on copy-on-write filesystems; otherwise
+    uses sendfile.
+    """
+    if hasattr(os, "copy_file_range"):
+        while os.copy_file_range(in_fd, out_fd, KERNEL_COPY_SIZE):
+            pass
+    else:
+        while os.sendfile(out_fd, in_fd, None, KERNEL_COPY_SIZE):
+            pass
+
+
 async def _delete_session(upload_id: str) -> None:
     """Delete upload session from Redis."""
     try:
         redis = await _get_redis()
-        await redis.delete(_session_key(upload_id))
+        await redis.delete(_session_key(upload_id), _received_key(upload_id))
     except Exception as e:
         logger.warning(f"Redis delete failed: {e}")
 
@@ -93,10 +251,9 @@ async def init_upload(
     upload_id = generate_id()
     session_dir = CHUNK_DIR / upload_id
     
-    try:
-        import aiofiles.os
-        await aiofiles.os.makedirs(session_dir, exist_ok=True)
-    except ImportError:
+    if _HAS_AIOFILES:
+        await aio_os.makedirs(session_dir, exist_ok=True)
+    else:
         session_dir.mkdir(parents=True, exist_ok=True)
     
     session = {
@@ -104,7 +261,6 @@ async def init_upload(
         "filename": filename,
         "total_size": total_size,
         "total_chunks": total_chunks,
-        "received_chunks": [],
         "session_dir": str(session_dir),
         "created_at": datetime.utcnow().isoformat(),
     }
@@ -122,6 +278,7 @@ async def upload_chunk(
     upload_id: str,
     chunk_index: int,
     chunk: UploadFile = File(...),
+    expected_hash: str | None = None,
 ) -> dict:
     """Upload a single chunk.
     
@@ -129,9 +286,10 @@ async def upload_chunk(
         upload_id: Session ID from init_upload
         chunk_index: Zero-based chunk index
         chunk: Chunk file data
+        expected_hash: Optional BLAKE2b hex digest to verify the chunk against
         
     Returns:
-        Chunk receipt confirmation
+        Chunk receipt confirmation including the chunk's BLAKE2b digest
     """
     session = await _get_session(upload_id)
     if not session:
@@ -140,27 +298,22 @@ async def upload_chunk(
     session_dir = Path(session["session_dir"])
     chunk_path = session_dir / f"chunk_{chunk_index:05d}"
     
-    content = await chunk.read()
-    
-    try:
-        import aiofiles
-        async with aiofiles.open(chunk_path, "wb") as f:
-            await f.write(content)
-    except ImportError:
-        with open(chunk_path, "wb") as f:
-            f.write(content)
-    
-    # Update received chunks
-    if chunk_index not in session["received_chunks"]:
-        session["received_chunks"].append(chunk_index)
-        await _save_session(upload_id, session)
+    size, digest = await _stream_to_file(chunk, chunk_path)
+    if expected_hash and expected_hash.lower() != digest:
+        chunk_path.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=400,
+            detail=f"Chunk {chunk_index} hash mismatch",
+        )
     
-    progress = len(session["received_chunks"]) / session["total_chunks"]
+    received_count = await _mark_chunk_received(upload_id, chunk_index)
+    progress = received_count / session["total_chunks"]
     
     return {
         "upload_id": upload_id,
         "chunk_index": chunk_index,
-        "size": len(content),
+        "size": size,
+        "hash": digest,
         "status": "received",
         "progress": progress,
     }
@@ -185,34 +338,25 @@ async def complete_upload(upload_id: str) -> dict:
     
     # Check all chunks received
     expected = set(range(session["total_chunks"]))
-    received = set(session["received_chunks"])
+    received = await _get_received_chunks(upload_id)
     missing = expected - received
     
     if missing:
+        missing_sample = heapq.nsmallest(10, missing)
         raise HTTPException(
             status_code=400,
-            detail=f"Missing chunks: {sorted(list(missing)[:10])}{'...' if len(missing) > 10 else ''}",
+            detail=f"Missing chunks: {missing_sample}{'...' if len(missing) > 10 else ''}",
         )
     
     # Reassemble chunks
-    chunks = sorted(session_dir.glob("chunk_*"))
+    chunks = _list_chunks(session_dir)
     final_path = session_dir / filename
     
-    try:
-        import aiofiles
-        async with aiofiles.open(final_path, "wb") as out:
-            for chunk_path in chunks:
-                async with aiofiles.open(chunk_path, "rb") as inp:
-                    await out.write(await inp.read())
-    except ImportError:
-        with open(final_path, "wb") as out:
-            for chunk_path in chunks:
-                with open(chunk_path, "rb") as inp:
-                    out.write(inp.read())
+    await asyncio.to_thread(_reassemble_chunks, chunks, final_path)
     
     # Cleanup chunk files
     for chunk_path in chunks:
-        chunk_path.unlink()
+        os.unlink(chunk_path)
     
     # Remove session from Redis
     await _delete_session(upload_id)
@@ -244,9 +388,9 @@ async def cancel_upload(upload_id: str) -> dict:
     session_dir = Path(session["session_dir"])
     
     # Delete all chunk files
-    for chunk_path in session_dir.glob("chunk_*"):
+    for chunk_path in _list_chunks(session_dir):
         try:
-            chunk_path.unlink()
+            os.unlink(chunk_path)
         except Exception:
             pass
     
@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from somaai.contracts.feedback import FeedbackRequest, FeedbackResponse
 from somaai.db.session import get_session
-from somaai.deps import get_actor_id
+from somaai.deps import get_actor_id, json_body, json_body_openapi
 from somaai.exceptions import (
     ConflictError,
     NotFoundError,
@@ -21,9 +21,10 @@ router = APIRouter(prefix="/feedback", tags=["feedback"])
     "",
     response_model=FeedbackResponse,
     status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_openapi(FeedbackRequest),
 )
 async def submit_feedback(
-    data: FeedbackRequest,
+    data: FeedbackRequest = Depends(json_body(FeedbackRequest)),
     db: AsyncSession = Depends(get_session),
     actor_id: str = Depends(get_actor_id),
 ) -> FeedbackResponse:
@@ -3,35 +3,44 @@
 Ingest = {upload, chunk, embed, store}
 """
 
+import asyncio
+import hashlib
+from collections.abc import AsyncIterator
 from pathlib import Path
 
 from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from somaai.contracts.common import GradeLevel, JobStatus, Subject
 from somaai.contracts.docs import DocumentResponse, IngestJobResponse
 from somaai.contracts.jobs import JobResponse
 from somaai.db import crud
+from somaai.db.models import Document
 from somaai.db.session import async_session_maker
 from somaai.jobs.queue import enqueue_job, get_job_status
 from somaai.providers.storage import get_storage
 from somaai.settings import settings
 from somaai.utils.ids import generate_id
 
-# Rate limiting setup
-try:
-    from slowapi import Limiter
-    from slowapi.util import get_remote_address
-    limiter = Limiter(key_func=get_remote_address)
-    RATE_LIMITING_ENABLED = True
-except ImportError:
-    limiter = None
-    RATE_LIMITING_ENABLED = False
-
 router = APIRouter(prefix="/ingest", tags=["ingest"])
 
 # Allowed file extensions
-ALLOWED_EXTENSIONS = {".pdf", ".docx", ".doc", ".txt", ".md"}
+ALLOWED_EXTENSIONS = frozenset({".pdf", ".docx", ".doc", ".txt", ".md"})
+_ALLOWED_STR = ", ".join(sorted(ALLOWED_EXTENSIONS))
+_ALLOWED_SUFFIXES = tuple(ALLOWED_EXTENSIONS)
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
+UPLOAD_READ_SIZE = 1024 * 1024  # 1MB per read when streaming uploads
+
+# How often the job event stream checks for status changes; no faster
+# than the 2s client polling it replaces
+JOB_EVENTS_INTERVAL = 2.0
+# Comment frame sent when nothing changed, to keep proxies from idling out
+JOB_EVENTS_KEEPALIVE = 15.0
+# Longest a single stream stays open; clients reconnect or poll after that
+JOB_EVENTS_MAX_DURATION = 600.0
+TERMINAL_JOB_STATUSES = {JobStatus.COMPLETED, JobStatus.FAILED}
 
 
 def validate_file(file: UploadFile) -> None:
@@ -46,14 +55,41 @@ def validate_file(file: UploadFile) -> None:
     if not file.filename:
         raise HTTPException(status_code=400, detail="No filename provided")
 
-    ext = Path(file.filename).suffix.lower()
-    if ext not in ALLOWED_EXTENSIONS:
+    if not file.filename.lower().endswith(_ALLOWED_SUFFIXES):
+        # Only build a Path on the rejection path, for the message
+        ext = Path(file.filename).suffix.lower()
         raise HTTPException(
             status_code=400,
-            detail=f"Unsupported file type: {ext}. Allowed: {', '.join(ALLOWED_EXTENSIONS)}",
+            detail=f"Unsupported file type: {ext}. Allowed: {_ALLOWED_STR}",
         )
 
 
+async def _read_limited(file: UploadFile, hasher=None) -> AsyncIterator[bytes]:
+    """Yield an upload in UPLOAD_READ_SIZE chunks, enforcing MAX_FILE_SIZE.
+
+    Size checking and hashing happen in the same pass as the storage
+    write, so the content is read exactly once.
+
+    Args:
+        file: Uploaded file
+        hasher: Optional hashlib object updated with each chunk
+
+    Raises:
+        HTTPException: If the upload exceeds MAX_FILE_SIZE
+    """
+    total = 0
+    while chunk := await file.read(UPLOAD_READ_SIZE):
+        total += len(chunk)
+        if total > MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"File too large. Maximum size: {MAX_FILE_SIZE // (1024*1024)}MB",
+            )
+        if hasher is not None:
+            hasher.update(chunk)
+        yield chunk
+
+
 @router.post("", response_model=IngestJobResponse)
 async def ingest_document(
     request: Request,
@@ -78,6 +114,12 @@ async def ingest_document(
     - doc_id: Document ID (immediate)
     - status: "pending"
 
+    If identical content was already uploaded for the same grade and
+    subject, doc_id is the existing document and:
+    - processed: no job is started, job_id is null, status "completed"
+    - pending/running: the existing job's id and status are returned
+    - failed: ingestion is restarted and a new job_id is returned
+
     Ingestion job will:
     - Extract text from document
     - Split into chunks
@@ -91,23 +133,19 @@ async def ingest_document(
     doc_id = generate_id()
     filename = file.filename or "document"
     doc_title = title or Path(filename).stem
+    grade_val, subject_val = grade.value, subject.value
 
     # 3. Save file to storage
     storage = get_storage()
     storage_path = f"documents/{doc_id}/{filename}"
 
-    try:
-        file_content = await file.read()
+    hasher = hashlib.blake2b()
 
-        # Check file size
-        if len(file_content) > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=400,
-                detail=f"File too large. Maximum size: {MAX_FILE_SIZE // (1024*1024)}MB",
-            )
-
-        # Save to storage
-        full_path = await storage.save(file_content, storage_path)
+    try:
+        # Stream to storage, enforcing the size limit and hashing as bytes arrive
+        full_path = await storage.save_stream(
+            _read_limited(file, hasher), storage_path
+        )
 
     except HTTPException:
         raise
@@ -117,35 +155,111 @@ async def ingest_document(
             detail=f"Failed to save file: {str(e)}",
         )
 
-    # 4. Create document record in database
+    content_hash = hasher.hexdigest()
+
+    # 4. Create document and job records in one transaction, skipping
+    # identical content. The job is dispatched only after the commit.
     async with async_session_maker() as db:
-        await crud.create_document(
-            db=db,
-            doc_id=doc_id,
-            filename=filename,
-            title=doc_title,
-            storage_path=full_path,
-            grade=grade.value,
-            subject=subject.value,
+        existing = await crud.get_document_by_hash(
+            db, content_hash, grade_val, subject_val
         )
-
-    # 5. Enqueue ingestion job
-    job_id = await enqueue_job(
+        if existing is None:
+            try:
+                await crud.create_document(
+                    db=db,
+                    doc_id=doc_id,
+                    filename=filename,
+                    title=doc_title,
+                    storage_path=full_path,
+                    grade=grade_val,
+                    subject=subject_val,
+                    content_hash=content_hash,
+                    commit=False,
+                )
+                job_id = await _enqueue_ingest(
+                    db, doc_id, full_path, grade_val, subject_val, doc_title
+                )
+                return IngestJobResponse(
+                    job_id=job_id,
+                    doc_id=doc_id,
+                    status=JobStatus.PENDING,
+                    message=f"Document '{doc_title}' uploaded. Ingestion started.",
+                )
+            except IntegrityError:
+                # Same content committed concurrently
+                await db.rollback()
+                existing = await crud.get_document_by_hash(
+                    db, content_hash, grade_val, subject_val
+                )
+                if existing is None:
+                    # Some other constraint failed, not a duplicate upload
+                    await storage.delete(storage_path)
+                    raise
+
+        # Identical content is already stored; keep the earlier copy
+        await storage.delete(storage_path)
+        return await _resume_existing(db, existing)
+
+
+async def _enqueue_ingest(
+    db: AsyncSession, doc_id: str, file_path: str, grade: str, subject: str, title: str
+) -> str:
+    """Commit pending changes with a new ingestion job and dispatch it."""
+    return await enqueue_job(
         task_name="ingest_document",
         payload={
             "doc_id": doc_id,
-            "file_path": full_path,
-            "grade": grade.value,
-            "subject": subject.value,
-            "title": doc_title,
+            "file_path": file_path,
+            "grade": grade,
+            "subject": subject,
+            "title": title,
         },
+        db=db,
     )
 
+
+async def _resume_existing(db: AsyncSession, existing: Document) -> IngestJobResponse:
+    """Report on, or retry, the ingestion of an already stored document.
+
+    Processed documents need no job. If the earlier job is still pending
+    or running its id and status are returned; if it failed (or there is
+    none) ingestion is started again for the existing document.
+    """
+    doc_id, doc_title = str(existing.id), str(existing.title)
+
+    if existing.processed_at is not None:
+        return IngestJobResponse(
+            job_id=None,
+            doc_id=doc_id,
+            status=JobStatus.COMPLETED,
+            message=f"Document '{doc_title}' was already ingested.",
+        )
+
+    job = await crud.get_latest_document_job(db, doc_id)
+    if job is not None and job.status in (
+        JobStatus.PENDING.value,
+        JobStatus.RUNNING.value,
+    ):
+        return IngestJobResponse(
+            job_id=str(job.id),
+            doc_id=doc_id,
+            status=JobStatus(job.status),
+            message=f"Document '{doc_title}' is already being ingested.",
+        )
+
+    job_id = await _enqueue_ingest(
+        db,
+        doc_id,
+        str(existing.storage_path),
+        str(existing.grade),
+        str(existing.subject),
+        doc_title,
+    )
     return IngestJobResponse(
         job_id=job_id,
         doc_id=doc_id,
         status=JobStatus.PENDING,
-        message=f"Document '{doc_title}' uploaded. Ingestion started.",
+        message=f"Document '{doc_title}' was not ingested yet. Ingestion restarted.",
     )
 
 
@@ -169,7 +283,68 @@ async def get_ingest_job_status(job_id: str):
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    return job
+    # Polled endpoint: serialize directly, skipping FastAPI's response
+    # validation; response_model still documents the shape
+    return Response(job.model_dump_json(), media_type="application/json")
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_ingest_job_events(job_id: str, request: Request):
+    """Stream ingestion job status changes as server-sent events.
+
+    Emits a `status` event with the JobResponse JSON whenever status or
+    progress changes, and closes after the job completes or fails. Idle
+    streams get a `: keepalive` comment every JOB_EVENTS_KEEPALIVE
+    seconds; after JOB_EVENTS_MAX_DURATION a `timeout` event with the
+    last known state is sent and the stream closes.
+    Clients can use this instead of polling /jobs/{job_id}.
+
+    Returns 404 if job not found.
+    """
+    job = await get_job_status(job_id)
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return StreamingResponse(
+        _job_events(job_id, job, request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _job_events(
+    job_id: str, job: JobResponse, request: Request
+) -> AsyncIterator[str]:
+    """Yield SSE frames for each job state change until it finishes.
+
+    Sends a keepalive comment when idle, and a final `timeout` event once
+    JOB_EVENTS_MAX_DURATION has passed so stuck jobs don't hold the
+    connection open forever.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + JOB_EVENTS_MAX_DURATION
+    last_state = None
+    last_sent = loop.time()
+    current: JobResponse | None = job
+    while current is not None:
+        state = (current.status, current.progress_pct)
+        if state != last_state:
+            last_state = state
+            last_sent = loop.time()
+            yield f"event: status\ndata: {current.model_dump_json()}\n\n"
+        elif loop.time() - last_sent >= JOB_EVENTS_KEEPALIVE:
+            last_sent = loop.time()
+            yield ": keepalive\n\n"
+
+        if current.status in TERMINAL_JOB_STATUSES or await request.is_disconnected():
+            return
+        if loop.time() >= deadline:
+            yield f"event: timeout\ndata: {current.model_dump_json()}\n\n"
+            return
+
+        await asyncio.sleep(JOB_EVENTS_INTERVAL)
+        current = await get_job_status(job_id)
 
 
 @router.get("/{doc_id}", response_model=DocumentResponse)
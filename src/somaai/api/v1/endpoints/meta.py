@@ -1,32 +1,86 @@
 """Meta endpoints for curriculum metadata."""
 
-from fastapi import APIRouter, Query
+import hashlib
 
+from fastapi import APIRouter, Query, Request, Response
+from pydantic import TypeAdapter
+
+from somaai.contracts.common import GradeLevel, Subject
 from somaai.contracts.meta import GradeResponse, SubjectResponse
 
 router = APIRouter(prefix="/meta", tags=["meta"])
 
+# Display names that title-casing the enum value gets wrong
+_SUBJECT_NAMES = {Subject.ICT: "ICT"}
+
+
+def _grade_response(order: int, grade: GradeLevel) -> GradeResponse:
+    """Build grade metadata from its enum member."""
+    primary = grade.value.startswith("P")
+    return GradeResponse(
+        id=grade.value,
+        name=f"{'Primary' if primary else 'Senior'} {grade.value[1:]}",
+        display_order=order,
+        level="primary" if primary else "secondary",
+    )
+
+
+def _subject_response(order: int, subject: Subject) -> SubjectResponse:
+    """Build subject metadata from its enum member."""
+    return SubjectResponse(
+        id=subject.value,
+        name=_SUBJECT_NAMES.get(subject, subject.value.replace("_", " ").title()),
+        display_order=order,
+    )
+
+
+def _etag(body: bytes) -> str:
+    """Strong ETag for a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+# Grades and subjects come from enums, so serialize them once at import
+_GRADES_JSON = TypeAdapter(list[GradeResponse]).dump_json(
+    [_grade_response(i, g) for i, g in enumerate(GradeLevel, start=1)]
+)
+_SUBJECTS_JSON = TypeAdapter(list[SubjectResponse]).dump_json(
+    [_subject_response(i, s) for i, s in enumerate(Subject, start=1)]
+)
+_GRADES_ETAG = _etag(_GRADES_JSON)
+_SUBJECTS_ETAG = _etag(_SUBJECTS_JSON)
+
+
+def _static_json(request: Request, body: bytes, etag: str) -> Response:
+    """Return a pre-serialized body, or 304 if the client already has it."""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
 
 @router.get("/grades", response_model=list[GradeResponse])
-async def get_grades():
+async def get_grades(request: Request):
     """Get all available grade levels.
 
     Returns list of grades (P1-P6 for primary, S1-S6 for secondary)
     with display names and sort order.
     """
-    pass
+    return _static_json(request, _GRADES_JSON, _GRADES_ETAG)
 
 
 @router.get("/subjects", response_model=list[SubjectResponse])
 async def get_subjects(
+    request: Request,
     grade: str | None = Query(None, description="Filter by grade ID"),
 ):
     """Get available subjects.
 
     Optionally filter by grade level.
     Returns all subjects if no grade specified.
+
+    Every subject is currently offered at every grade, so the filter
+    does not narrow the list yet.
     """
-    pass
+    return _static_json(request, _SUBJECTS_JSON, _SUBJECTS_ETAG)
 
 
 # @router.get("/topics", response_model=list[TopicResponse])
@@ -1,6 +1,6 @@
 """Quiz endpoints."""
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
 
 from somaai.contracts.quiz import (
     DownloadFormat,
@@ -8,13 +8,18 @@ from somaai.contracts.quiz import (
     QuizGenerateRequest,
     QuizResponse,
 )
+from somaai.deps import json_body, json_body_openapi
 
 router = APIRouter(prefix="/quiz", tags=["quiz"])
 
 
-@router.post("/generate", response_model=dict)
+@router.post(
+    "/generate",
+    response_model=dict,
+    openapi_extra=json_body_openapi(QuizGenerateRequest),
+)
 async def generate_quiz(
-    data: QuizGenerateRequest,
+    data: QuizGenerateRequest = Depends(json_body(QuizGenerateRequest)),
 ):
     """Generate a new quiz.
 
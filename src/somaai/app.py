@@ -1,28 +1,63 @@
 """FastAPI application factory."""
 
+import asyncio
+import contextlib
+import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
 from somaai.api.router import api_router
+from somaai.api.security import run_rate_limiter_janitor
 from somaai.db.session import close_db
 from somaai.health import health_router
+from somaai.jobs.queue import close_job_batcher, close_redis_pool
 from somaai.middleware import setup_middleware
+from somaai.providers.http import create_http_client
 from somaai.providers.llm import get_llm
-from somaai.settings import settings
+from somaai.settings import Settings, settings
+
+logger = logging.getLogger(__name__)
+
+
+def _load_embeddings(settings: Settings):
+    """Load the shared embeddings model, or None if RAG extras are unavailable."""
+    try:
+        from somaai.modules.knowledge.stores.qdrant import get_embeddings_model
+    except ImportError:
+        return None
+
+    try:
+        return get_embeddings_model(settings)
+    except Exception as e:
+        logger.warning(f"Embeddings model preload failed: {e}")
+        return None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan."""
-    ## We create the LLM instance here to ensure it's ready when needed.
-    app.state.llm = get_llm(settings)
+    ## We create the LLM and embeddings instances here to ensure they're ready
+    ## when needed. They're independent, so load them concurrently off-loop.
+    app.state.llm, app.state.embeddings = await asyncio.gather(
+        asyncio.to_thread(get_llm, settings),
+        asyncio.to_thread(_load_embeddings, settings),
+    )
+    app.state.http = create_http_client()
+    janitor = asyncio.create_task(run_rate_limiter_janitor())
 
     try:
         yield
     finally:
+        janitor.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await janitor
+        await app.state.http.aclose()
+        await close_job_batcher()
+        await close_redis_pool()
         await close_db()
         app.state.llm = None
+        app.state.embeddings = None
 
 
 def create_app() -> FastAPI:
@@ -9,8 +9,12 @@ aiocache provides:
 Install: uv add aiocache[redis]
 """
 
+import hashlib
+import time
+from collections import OrderedDict
 from collections.abc import Callable
-from functools import wraps
+from functools import lru_cache, wraps
+from typing import Any
 
 try:
     from aiocache import Cache, cached
@@ -21,7 +25,8 @@ except ImportError:
     AIOCACHE_AVAILABLE = False
     cached = None
 
-from somaai.cache.config import get_cache_config
+from somaai.cache.config import CacheConfig, get_cache_config
+from somaai.utils.redis import parse_redis_url
 
 
 def _ensure_aiocache():
@@ -33,22 +38,39 @@ def _ensure_aiocache():
         )
 
 
-def _build_key(func_name: str, *args, **kwargs) -> str:
-    """Build a cache key from function name and arguments."""
-    config = get_cache_config()
-    key_parts = [config.namespace, func_name]
+@lru_cache(maxsize=4)
+def _parsed_redis(url: str) -> tuple[str, int, int, str | None]:
+    """Parse a Redis URL once per distinct URL."""
+    return parse_redis_url(url)
+
 
-    # Add positional args (skip 'self' if present)
-    for arg in args:
-        if hasattr(arg, "__class__") and arg.__class__.__name__ in ("self", "cls"):
-            continue
-        key_parts.append(str(arg)[:50])  # Truncate long args
+def _redis_kwargs(config: CacheConfig) -> dict:
+    """Build aiocache Redis connection kwargs from cache config."""
+    host, port, db, password = _parsed_redis(config.redis_url)
+    return {
+        "endpoint": host,
+        "port": port,
+        "db": db,
+        "password": password or config.redis_password,
+    }
 
-    # Add keyword args
-    for k, v in sorted(kwargs.items()):
-        key_parts.append(f"{k}={str(v)[:50]}")
 
-    return ":".join(key_parts)
+def _build_key(func_name: str, *args, **kwargs) -> str:
+    """Build a cache key from function name and arguments.
+
+    Arguments are hashed in full, so the key length is bounded and long
+    arguments sharing a prefix no longer collide. The readable
+    namespace:func prefix is kept for pattern deletes.
+    """
+    config = get_cache_config()
+
+    # Skip 'self' if present
+    args = tuple(
+        arg for arg in args if arg.__class__.__name__ not in ("self", "cls")
+    )
+    payload = repr((func_name, args, tuple(sorted(kwargs.items()))))
+    digest = hashlib.blake2b(payload.encode(), digest_size=10).hexdigest()
+    return f"{config.namespace}:{func_name}:{digest}"
 
 
 def cached_query(
@@ -68,12 +90,7 @@ def cached_query(
     return cached(
         ttl=ttl or config.query_ttl,
         cache=Cache.REDIS,
-        endpoint=config.redis_url.split("://")[1].split(":")[0]
-        if "://" in config.redis_url
-        else "localhost",
-        port=int(config.redis_url.split(":")[-1].split("/")[0])
-        if ":" in config.redis_url
-        else 6379,
+        **_redis_kwargs(config),
         namespace=f"{config.namespace}:query",
         serializer=JsonSerializer(),
         key_builder=key_builder
@@ -98,12 +115,7 @@ def cached_embedding(
     return cached(
         ttl=ttl or config.embedding_ttl,
         cache=Cache.REDIS,
-        endpoint=config.redis_url.split("://")[1].split(":")[0]
-        if "://" in config.redis_url
-        else "localhost",
-        port=int(config.redis_url.split(":")[-1].split("/")[0])
-        if ":" in config.redis_url
-        else 6379,
+        **_redis_kwargs(config),
         namespace=f"{config.namespace}:embed",
         serializer=JsonSerializer(),
         key_builder=key_builder
@@ -128,12 +140,7 @@ def cached_retrieval(
     return cached(
         ttl=ttl or config.retrieval_ttl,
         cache=Cache.REDIS,
-        endpoint=config.redis_url.split("://")[1].split(":")[0]
-        if "://" in config.redis_url
-        else "localhost",
-        port=int(config.redis_url.split(":")[-1].split("/")[0])
-        if ":" in config.redis_url
-        else 6379,
+        **_redis_kwargs(config),
         namespace=f"{config.namespace}:retrieval",
         serializer=JsonSerializer(),
         key_builder=key_builder
@@ -154,29 +161,23 @@ class SimpleCache:
     MAX_ENTRIES = 1000  # Prevent unbounded growth
 
     def __init__(self):
-        import time
-        self._cache: dict[str, tuple[float, any]] = {}  # {key: (expires_at, value)}
-        self._access_order: list[str] = []  # For LRU eviction
+        # {key: (expires_at, value)}, ordered least to most recently used
+        self._cache: OrderedDict[str, tuple[float, Any]] = OrderedDict()
 
     def _evict_expired(self) -> None:
         """Remove expired entries."""
-        import time
         now = time.time()
         expired = [k for k, (exp, _) in self._cache.items() if exp < now]
         for key in expired:
-            self._cache.pop(key, None)
-            if key in self._access_order:
-                self._access_order.remove(key)
+            del self._cache[key]
 
     def _evict_lru(self) -> None:
         """Evict least recently used if over limit."""
-        while len(self._cache) >= self.MAX_ENTRIES and self._access_order:
-            oldest = self._access_order.pop(0)
-            self._cache.pop(oldest, None)
+        while len(self._cache) >= self.MAX_ENTRIES:
+            self._cache.popitem(last=False)
 
     def cached(self, ttl: int = 3600):
         """Caching decorator with TTL."""
-        import time
 
         def decorator(func):
             @wraps(func)
@@ -186,17 +187,15 @@ class SimpleCache:
                 key = _build_key(func.__name__, *args, **kwargs)
                 now = time.time()
                 
-                if key in self._cache:
-                    expires_at, value = self._cache[key]
+                entry = self._cache.get(key)
+                if entry is not None:
+                    expires_at, value = entry
                     if expires_at > now:
-                        # Update access order
-                        if key in self._access_order:
-                            self._access_order.remove(key)
-                        self._access_order.append(key)
+                        self._cache.move_to_end(key)
                         return value
                     else:
                         # Expired
-                        self._cache.pop(key, None)
+                        del self._cache[key]
 
                 result = await func(*args, **kwargs)
                 
@@ -205,7 +204,6 @@ class SimpleCache:
                 
                 # Store with expiration
                 self._cache[key] = (now + ttl, result)
-                self._access_order.append(key)
                 
                 return result
 
@@ -216,7 +214,6 @@ class SimpleCache:
     def clear(self):
         """Clear all cached items."""
         self._cache.clear()
-        self._access_order.clear()
 
 
 # Fallback cache instance
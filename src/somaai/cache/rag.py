@@ -1,19 +1,81 @@
 """RAG-specific caching for embeddings and responses.
 
 Integrates with existing cache infrastructure but adds RAG-specific logic.
-Uses Decimal for precise confidence score handling.
+Confidence thresholds are configured as Decimal.
 """
 
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
+import os
+import time
+from collections import OrderedDict
 from decimal import Decimal
+from functools import cache, lru_cache
 from typing import Any
 
+from somaai.utils.serialization import json_dumps, json_loads
+
 logger = logging.getLogger(__name__)
 
+# Keys unlinked per command when invalidating by pattern
+INVALIDATE_BATCH_SIZE = 500
+
+# Entries kept in each process-local L1 cache
+_L1_MAX = 512
+
+# Seconds a response may live in L1. invalidate_pattern only clears the
+# calling process's L1, so other workers may serve an invalidated
+# response for up to this long before falling through to Redis.
+_L1_RESPONSE_TTL = 5
+
+
+@lru_cache(maxsize=4096)
+def _hash16(value: str) -> str:
+    """Hash a string to a 16-hex-char cache key component.
+
+    BLAKE2b with an 8-byte digest: keys only need to be well spread,
+    not collision-resistant against attackers. Memoized so repeat
+    queries skip hashing.
+    """
+    return hashlib.blake2b(value.encode(), digest_size=8).hexdigest()
+
+
+class _L1Cache:
+    """Process-local LRU in front of Redis, honouring the same TTL.
+
+    Lookups are O(1) and never await, so repeat keys within a burst skip
+    the Redis round-trip. Writes are idempotent, so concurrent tasks
+    racing on the same key need no lock.
+    """
+
+    def __init__(self, ttl: int, max_entries: int = _L1_MAX):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # {key: (expires_at, value)}, ordered least to most recently used
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
 
 class EmbeddingCache:
     """Cache for query embeddings to avoid re-embedding identical queries.
@@ -29,15 +91,21 @@ class EmbeddingCache:
             ttl: Time-to-live in seconds (default: 1 hour)
         """
         self.ttl = ttl
+        self._l1 = _L1Cache(ttl)
         self._redis = redis_client
+        # Set when the client is fetched lazily, so forks refetch it
+        self._redis_pid: int | None = None
         self._enabled = True
 
     async def _get_redis(self):
-        """Get Redis client lazily."""
-        if self._redis is None:
+        """Get Redis client lazily, again in each forked worker."""
+        if self._redis is None or (
+            self._redis_pid is not None and self._redis_pid != os.getpid()
+        ):
             try:
                 from somaai.utils.redis import get_cache_redis
                 self._redis = await get_cache_redis()
+                self._redis_pid = os.getpid()
             except Exception as e:
                 logger.warning(f"Failed to initialize embedding cache: {e}")
                 self._enabled = False
@@ -45,25 +113,31 @@ class EmbeddingCache:
 
     def _make_key(self, query: str) -> str:
         """Generate cache key from query."""
-        query_hash = hashlib.sha256(query.encode()).hexdigest()[:16]
-        return f"rag:emb:{query_hash}"
+        return f"rag:emb:{_hash16(query)}"
 
     async def get(self, query: str) -> list[float] | None:
         """Get cached embedding for query."""
         if not self._enabled:
             return None
 
+        key = self._make_key(query)
+        embedding = self._l1.get(key)
+        if embedding is not None:
+            # L1 holds a tuple; hand out a fresh list callers may mutate
+            return list(embedding)
+
         try:
             redis = await self._get_redis()
             if not redis:
                 return None
 
-            key = self._make_key(query)
             cached = await redis.get(key)
 
             if cached:
                 logger.debug(f"Embedding cache HIT: {query[:50]}...")
-                return json.loads(cached)
+                embedding = json_loads(cached)
+                self._l1.set(key, tuple(embedding))
+                return embedding
 
             return None
 
@@ -76,15 +150,15 @@ class EmbeddingCache:
         if not self._enabled:
             return
 
+        key = self._make_key(query)
+        self._l1.set(key, tuple(embedding))
+
         try:
             redis = await self._get_redis()
             if not redis:
                 return
-            
-            from somaai.utils.serialization import json_serializer
 
-            key = self._make_key(query)
-            await redis.setex(key, self.ttl, json.dumps(embedding, default=json_serializer))
+            await redis.setex(key, self.ttl, json_dumps(embedding))
 
         except Exception as e:
             logger.warning(f"Embedding cache set failed: {e}")
@@ -106,15 +180,24 @@ class ResponseCache:
         """
         self.ttl = ttl
         self.min_confidence = min_confidence
+        # Float copy for the per-request threshold check
+        self._min_confidence_f = float(min_confidence)
+        # Short-lived so invalidations reach other workers quickly
+        self._l1 = _L1Cache(min(ttl, _L1_RESPONSE_TTL))
         self._redis = redis_client
+        # Set when the client is fetched lazily, so forks refetch it
+        self._redis_pid: int | None = None
         self._enabled = True
 
     async def _get_redis(self):
-        """Get Redis client lazily."""
-        if self._redis is None:
+        """Get Redis client lazily, again in each forked worker."""
+        if self._redis is None or (
+            self._redis_pid is not None and self._redis_pid != os.getpid()
+        ):
             try:
                 from somaai.utils.redis import get_cache_redis
                 self._redis = await get_cache_redis()
+                self._redis_pid = os.getpid()
             except Exception as e:
                 logger.warning(f"Failed to initialize response cache: {e}")
                 self._enabled = False
@@ -122,9 +205,7 @@ class ResponseCache:
 
     def _make_key(self, query: str, grade: str, subject: str) -> str:
         """Generate cache key from query parameters."""
-        data = f"{query}|{grade}|{subject}".encode()
-        key_hash = hashlib.sha256(data).hexdigest()[:16]
-        return f"rag:resp:{key_hash}"
+        return f"rag:resp:{_hash16(f'{query}|{grade}|{subject}')}"
 
     async def get(
         self,
@@ -136,19 +217,24 @@ class ResponseCache:
         if not self._enabled:
             return None
 
+        key = self._make_key(query, grade, subject)
+        response = self._l1.get(key)
+        if response is not None:
+            # Callers may mutate the response; keep the L1 entry intact
+            return {**response, "from_cache": True}
+
         try:
             redis = await self._get_redis()
             if not redis:
                 return None
 
-            key = self._make_key(query, grade, subject)
             cached = await redis.get(key)
 
             if cached:
                 logger.info(f"Response cache HIT: {query[:50]}...")
-                response = json.loads(cached)
-                response["from_cache"] = True
-                return response
+                response = json_loads(cached)
+                self._l1.set(key, response)
+                return {**response, "from_cache": True}
 
             return None
 
@@ -170,82 +256,83 @@ class ResponseCache:
         if not self._enabled:
             return
 
-        # Quality check - use Decimal for precise comparison
-        confidence_raw = response.get("confidence", 0)
-        confidence = Decimal(str(confidence_raw))
+        # Quality check - float precision is plenty for a threshold compare
+        confidence = float(response.get("confidence", 0))
         is_grounded = response.get("is_grounded", True)
 
-        if confidence < self.min_confidence or not is_grounded:
+        if confidence < self._min_confidence_f or not is_grounded:
             logger.debug(f"Skipping cache: confidence={confidence}, grounded={is_grounded}")
             return
 
+        key = self._make_key(query, grade, subject)
+
+        # Don't cache large fields
+        response_copy = response.copy()
+        response_copy.pop("citations", None)
+        self._l1.set(key, response_copy)
+
         try:
             redis = await self._get_redis()
             if not redis:
                 return
 
-            key = self._make_key(query, grade, subject)
-
-            # Don't cache large fields
-            response_copy = {k: v for k, v in response.items()}
-            response_copy.pop("citations", None)
-
-            from somaai.utils.serialization import json_serializer
-            await redis.setex(key, self.ttl, json.dumps(response_copy, default=json_serializer))
+            await redis.setex(key, self.ttl, json_dumps(response_copy))
             logger.info(f"Cached response: {query[:50]}...")
 
         except Exception as e:
             logger.warning(f"Response cache set failed: {e}")
 
     async def invalidate_pattern(self, pattern: str = "rag:resp:*") -> int:
-        """Invalidate cache entries matching pattern."""
+        """Invalidate cache entries matching pattern.
+
+        Only this process's L1 is cleared; other workers keep serving their
+        L1 copies for up to ``_L1_RESPONSE_TTL`` seconds.
+        """
         if not self._enabled:
             return 0
 
+        # L1 keys are hashed, so any invalidation drops the whole tier
+        self._l1.clear()
+
         try:
             redis = await self._get_redis()
             if not redis:
                 return 0
 
-            keys = []
-            async for key in redis.scan_iter(match=pattern):
-                keys.append(key)
+            deleted = 0
+            batch = []
+            async for key in redis.scan_iter(match=pattern, count=1000):
+                batch.append(key)
+                if len(batch) >= INVALIDATE_BATCH_SIZE:
+                    deleted += await redis.unlink(*batch)
+                    batch.clear()
 
-            if keys:
-                deleted = await redis.delete(*keys)
-                logger.info(f"Invalidated {deleted} cache entries")
-                return deleted
+            if batch:
+                deleted += await redis.unlink(*batch)
 
-            return 0
+            if deleted:
+                logger.info(f"Invalidated {deleted} cache entries")
+            return deleted
 
         except Exception as e:
             logger.error(f"Cache invalidation failed: {e}")
             return 0
 
 
-# Singleton instances
-_embedding_cache: EmbeddingCache | None = None
-_response_cache: ResponseCache | None = None
-
-
+@cache
 def get_embedding_cache() -> EmbeddingCache:
     """Get singleton embedding cache instance."""
-    global _embedding_cache
-    if _embedding_cache is None:
-        from somaai.cache.config import get_cache_config
-        config = get_cache_config()
-        _embedding_cache = EmbeddingCache(ttl=config.embedding_ttl)
-    return _embedding_cache
+    from somaai.cache.config import get_cache_config
+    config = get_cache_config()
+    return EmbeddingCache(ttl=config.embedding_ttl)
 
 
+@cache
 def get_response_cache() -> ResponseCache:
     """Get singleton response cache instance."""
-    global _response_cache
-    if _response_cache is None:
-        from somaai.cache.config import get_cache_config
-        config = get_cache_config()
-        _response_cache = ResponseCache(
-            ttl=config.query_ttl,  # Use query_ttl for responses
-            min_confidence=Decimal("0.7"),
-        )
-    return _response_cache
+    from somaai.cache.config import get_cache_config
+    config = get_cache_config()
+    return ResponseCache(
+        ttl=config.query_ttl,  # Use query_ttl for responses
+        min_confidence=Decimal("0.7"),
+    )
@@ -2,52 +2,89 @@
 
 This module contains all request/response schemas used by the API.
 Centralizing contracts ensures consistency across endpoints.
+
+Names are resolved lazily (PEP 562): importing one contracts submodule
+does not import, and build the Pydantic models of, all the others.
 """
 
-from somaai.contracts.chat import (
-    ChatRequest,
-    ChatResponse,
-    CitationResponse,
-    MessageResponse,
-)
-from somaai.contracts.common import (
-    GradeLevel,
-    PaginatedResponse,
-    Subject,
-    UserRole,
-)
-from somaai.contracts.docs import (
-    DocumentResponse,
-    IngestJobResponse,
-    # IngestRequest,
-)
-from somaai.contracts.errors import (
-    ErrorResponse,
-    ValidationErrorResponse,
-)
-from somaai.contracts.feedback import (
-    FeedbackRequest,
-    FeedbackResponse,
-)
-from somaai.contracts.jobs import (
-    JobResponse,
-    JobStatus,
-)
-from somaai.contracts.meta import (
-    GradeResponse,
-    SubjectResponse,
-    TopicResponse,
-)
-from somaai.contracts.quiz import (
-    QuizDownloadParams,
-    QuizGenerateRequest,
-    QuizItemResponse,
-    QuizResponse,
-)
-from somaai.contracts.teacher import (
-    TeacherProfileRequest,
-    TeacherProfileResponse,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from somaai.contracts.chat import (
+        ChatRequest,
+        ChatResponse,
+        CitationResponse,
+        MessageResponse,
+    )
+    from somaai.contracts.common import (
+        GradeLevel,
+        PaginatedResponse,
+        Subject,
+        UserRole,
+    )
+    from somaai.contracts.docs import (
+        DocumentResponse,
+        IngestJobResponse,
+    )
+    from somaai.contracts.errors import (
+        ErrorResponse,
+        ValidationErrorResponse,
+    )
+    from somaai.contracts.feedback import (
+        FeedbackRequest,
+        FeedbackResponse,
+    )
+    from somaai.contracts.jobs import (
+        JobResponse,
+        JobStatus,
+    )
+    from somaai.contracts.meta import (
+        GradeResponse,
+        SubjectResponse,
+        TopicResponse,
+    )
+    from somaai.contracts.quiz import (
+        QuizDownloadParams,
+        QuizGenerateRequest,
+        QuizItemResponse,
+        QuizResponse,
+    )
+    from somaai.contracts.teacher import (
+        TeacherProfileRequest,
+        TeacherProfileResponse,
+    )
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    "ChatRequest": "chat",
+    "ChatResponse": "chat",
+    "CitationResponse": "chat",
+    "MessageResponse": "chat",
+    "GradeLevel": "common",
+    "PaginatedResponse": "common",
+    "Subject": "common",
+    "UserRole": "common",
+    "DocumentResponse": "docs",
+    "IngestJobResponse": "docs",
+    "ErrorResponse": "errors",
+    "ValidationErrorResponse": "errors",
+    "FeedbackRequest": "feedback",
+    "FeedbackResponse": "feedback",
+    "JobResponse": "jobs",
+    "JobStatus": "jobs",
+    "GradeResponse": "meta",
+    "SubjectResponse": "meta",
+    "TopicResponse": "meta",
+    "QuizDownloadParams": "quiz",
+    "QuizGenerateRequest": "quiz",
+    "QuizItemResponse": "quiz",
+    "QuizResponse": "quiz",
+    "TeacherProfileRequest": "teacher",
+    "TeacherProfileResponse": "teacher",
+}
 
 __all__ = [
     # Common
@@ -65,7 +102,6 @@ __all__ = [
     "CitationResponse",
     # Docs
     "DocumentResponse",
-    # "IngestRequest",
     "IngestJobResponse",
     # Quiz
     "QuizGenerateRequest",
@@ -86,3 +122,17 @@ __all__ = [
     "JobStatus",
     "JobResponse",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining submodule on first access to an exported name."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from somaai.contracts.common import GradeLevel, JobStatus, Subject
 
@@ -26,7 +26,12 @@ class IngestJobResponse(BaseModel):
     Contains job ID for tracking ingestion progress.
     """
 
-    job_id: str = Field(..., description="Background job ID")
+    # Status is stored as its plain string value
+    model_config = ConfigDict(use_enum_values=True)
+
+    job_id: str | None = Field(
+        ..., description="Background job ID (None if content was already ingested)"
+    )
     doc_id: str = Field(..., description="Document ID (available immediately)")
     status: JobStatus = Field(..., description="Initial job status (pending)")
     message: str = Field(..., description="Status message")
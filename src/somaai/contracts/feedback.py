@@ -1,8 +1,9 @@
 """Feedback endpoint schemas."""
 
 from datetime import datetime
+from typing import Annotated
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 from somaai.contracts.common import UserRole
 
@@ -30,7 +31,9 @@ class FeedbackRequest(BaseModel):
     text: str | None = Field(
         None, max_length=1000, description="Optional feedback text"
     )
-    tags: list[str] | None = Field(None, description="Optional feedback tags")
+    tags: list[Annotated[str, StringConstraints(max_length=64)]] | None = Field(
+        None, max_length=16, description="Optional feedback tags"
+    )
     user_role: UserRole = Field(..., description="User role")
 
 
@@ -3,14 +3,20 @@
 Provides async database operations for Job and Document models.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from somaai.db.models import Document, Job
 
 
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching the naive DateTime columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 # ====================
 # Job CRUD Operations
 # ====================
@@ -21,6 +27,7 @@ async def create_job(
     job_id: str,
     task_name: str,
     payload: dict,
+    commit: bool = True,
 ) -> Job:
     """Create a new job record.
     
@@ -29,6 +36,8 @@ async def create_job(
         job_id: Unique job identifier
         task_name: Name of the task to execute
         payload: Task-specific payload data
+        commit: If False, only add to the session so the caller can
+            commit it together with other pending changes
         
     Returns:
         Created Job instance
@@ -39,11 +48,11 @@ async def create_job(
         payload=payload,
         status="pending",
         progress_pct=0,
-        created_at=datetime.utcnow(),
+        created_at=_utcnow(),
     )
     db.add(job)
-    await db.commit()
-    await db.refresh(job)
+    if commit:
+        await db.commit()
     return job
 
 
@@ -61,6 +70,22 @@ async def get_job(db: AsyncSession, job_id: str) -> Job | None:
     return result.scalar_one_or_none()
 
 
+async def get_jobs(db: AsyncSession, job_ids: list[str]) -> list[Job]:
+    """Get several jobs by ID in one query.
+
+    Args:
+        db: Database session
+        job_ids: Job identifiers
+
+    Returns:
+        Job instances that exist, in no particular order
+    """
+    if not job_ids:
+        return []
+    result = await db.execute(select(Job).where(Job.id.in_(job_ids)))
+    return list(result.scalars().all())
+
+
 async def update_job_status(
     db: AsyncSession,
     job_id: str,
@@ -68,6 +93,7 @@ async def update_job_status(
     progress_pct: int = 0,
     result_id: str | None = None,
     error: str | None = None,
+    commit: bool = True,
 ) -> Job | None:
     """Update job status.
     
@@ -78,25 +104,31 @@ async def update_job_status(
         progress_pct: Progress percentage (0-100)
         result_id: Result ID if completed
         error: Error message if failed
+        commit: Commit immediately; pass False to commit together with
+            other changes in the same session
         
     Returns:
         Updated Job instance if found, None otherwise
     """
-    job = await get_job(db, job_id)
-    if not job:
-        return None
-    
-    job.status = status
-    job.progress_pct = progress_pct
-    job.result_id = result_id
-    job.error = error
-    
-    if status == "running" and not job.started_at:
-        job.started_at = datetime.utcnow()
+    values = {
+        "status": status,
+        "progress_pct": progress_pct,
+        "result_id": result_id,
+        "error": error,
+    }
+    if status == "running":
+        # Keep the first start time if the job is retried
+        values["started_at"] = func.coalesce(Job.started_at, _utcnow())
     elif status in ("completed", "failed"):
-        job.completed_at = datetime.utcnow()
-    
-    await db.commit()
+        values["completed_at"] = _utcnow()
+
+    # Single UPDATE ... RETURNING instead of SELECT then UPDATE
+    result = await db.execute(
+        update(Job).where(Job.id == job_id).values(**values).returning(Job)
+    )
+    job = result.scalar_one_or_none()
+    if commit:
+        await db.commit()
     return job
 
 
@@ -115,15 +147,72 @@ async def update_job_progress(
     Returns:
         Updated Job instance if found, None otherwise
     """
-    job = await get_job(db, job_id)
-    if not job:
-        return None
-    
-    job.progress_pct = progress_pct
+    result = await db.execute(
+        update(Job)
+        .where(Job.id == job_id)
+        .values(progress_pct=progress_pct)
+        .returning(Job)
+    )
+    job = result.scalar_one_or_none()
     await db.commit()
     return job
 
 
+async def update_jobs_progress(db: AsyncSession, progress: dict[str, int]) -> None:
+    """Update progress for several jobs in one executemany.
+    
+    Jobs that already finished keep their final progress, so a late
+    buffered update cannot move a completed job backwards.
+    
+    Args:
+        db: Database session
+        progress: Mapping of job ID to progress percentage
+    """
+    if not progress:
+        return
+
+    jobs = Job.__table__
+    stmt = (
+        update(jobs)
+        .where(
+            jobs.c.id == bindparam("b_id"),
+            jobs.c.status.notin_(("completed", "failed")),
+        )
+        .values(progress_pct=bindparam("b_pct"))
+    )
+    await db.execute(
+        stmt, [{"b_id": job_id, "b_pct": pct} for job_id, pct in progress.items()]
+    )
+    await db.commit()
+
+
+async def get_latest_document_job(
+    db: AsyncSession,
+    doc_id: str,
+    task_name: str = "ingest_document",
+) -> Job | None:
+    """Get the most recent job started for a document.
+
+    Args:
+        db: Database session
+        doc_id: Document identifier stored in the job payload
+        task_name: Task the job ran
+
+    Returns:
+        Latest matching Job instance, None if there is none
+    """
+    result = await db.execute(
+        select(Job)
+        .where(
+            Job.task_name == task_name,
+            Job.payload["doc_id"].as_string() == doc_id,
+        )
+        .order_by(Job.created_at.desc(), Job.id.desc())
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
 async def get_pending_jobs(db: AsyncSession, limit: int = 10) -> list[Job]:
     """Get pending jobs for processing.
     
@@ -156,6 +245,8 @@ async def create_document(
     storage_path: str,
     grade: str,
     subject: str,
+    content_hash: str | None = None,
+    commit: bool = True,
 ) -> Document:
     """Create a new document record.
     
@@ -167,9 +258,16 @@ async def create_document(
         storage_path: Path to stored file
         grade: Grade level
         subject: Subject
+        content_hash: Hash of the file content, for deduplication
+        commit: If False, only add to the session so the caller can
+            commit it together with other pending changes
         
     Returns:
         Created Document instance
+
+    Raises:
+        IntegrityError: If a document with the same content_hash, grade
+            and subject already exists (raised at commit)
     """
     doc = Document(
         id=doc_id,
@@ -178,10 +276,11 @@ async def create_document(
         storage_path=storage_path,
         grade=grade,
         subject=subject,
+        content_hash=content_hash,
     )
     db.add(doc)
-    await db.commit()
-    await db.refresh(doc)
+    if commit:
+        await db.commit()
     return doc
 
 
@@ -199,10 +298,59 @@ async def get_document(db: AsyncSession, doc_id: str) -> Document | None:
     return result.scalar_one_or_none()
 
 
+async def get_document_with_chunks(db: AsyncSession, doc_id: str) -> Document | None:
+    """Get document by ID with its chunks loaded.
+    
+    Chunks are fetched by one extra IN query (selectinload) rather than
+    lazily, which an async session cannot do anyway.
+    
+    Args:
+        db: Database session
+        doc_id: Document identifier
+        
+    Returns:
+        Document instance with chunks ordered by chunk_index, or None
+    """
+    result = await db.execute(
+        select(Document)
+        .options(selectinload(Document.chunks))
+        .where(Document.id == doc_id)
+    )
+    return result.scalar_one_or_none()
+
+
+async def get_document_by_hash(
+    db: AsyncSession,
+    content_hash: str,
+    grade: str,
+    subject: str,
+) -> Document | None:
+    """Get a document by content hash within a grade and subject.
+    
+    Args:
+        db: Database session
+        content_hash: Hash of the file content
+        grade: Grade level
+        subject: Subject
+        
+    Returns:
+        Document instance if found, None otherwise
+    """
+    result = await db.execute(
+        select(Document).where(
+            Document.content_hash == content_hash,
+            Document.grade == grade,
+            Document.subject == subject,
+        )
+    )
+    return result.scalar_one_or_none()
+
+
 async def update_document_processed(
     db: AsyncSession,
     doc_id: str,
     page_count: int,
+    commit: bool = True,
 ) -> Document | None:
     """Mark document as processed.
     
@@ -210,6 +358,8 @@ async def update_document_processed(
         db: Database session
         doc_id: Document identifier
         page_count: Number of pages in document
+        commit: Commit immediately; pass False to commit together with
+            other changes in the same session
         
     Returns:
         Updated Document instance if found, None otherwise
@@ -218,9 +368,10 @@ async def update_document_processed(
     if not doc:
         return None
     
-    doc.processed_at = datetime.utcnow()
+    doc.processed_at = _utcnow()
     doc.page_count = page_count
-    await db.commit()
+    if commit:
+        await db.commit()
     return doc
 
 
@@ -235,7 +386,7 @@ async def create_chunks(
 ) -> list[str]:
     """Create chunk records for a document.
     
-    Uses bulk insert for efficiency (single DB roundtrip).
+    Uses a Core bulk insert for efficiency (single executemany).
     
     Args:
         db: Database session
@@ -256,25 +407,24 @@ async def create_chunks(
     if not chunks:
         return []
     
-    # Build all chunk objects first
-    chunk_objects = [
-        Chunk(
-            id=chunk_data["id"],
-            document_id=chunk_data["document_id"],
-            content=chunk_data["content"],
-            page_start=chunk_data["page_start"],
-            page_end=chunk_data["page_end"],
-            chunk_index=chunk_data["chunk_index"],
-            embedding_id=chunk_data.get("embedding_id"),
-        )
+    rows = [
+        {
+            "id": chunk_data["id"],
+            "document_id": chunk_data["document_id"],
+            "content": chunk_data["content"],
+            "page_start": chunk_data["page_start"],
+            "page_end": chunk_data["page_end"],
+            "chunk_index": chunk_data["chunk_index"],
+            "embedding_id": chunk_data.get("embedding_id"),
+        }
         for chunk_data in chunks
     ]
-    
-    # Bulk insert (single roundtrip)
-    db.add_all(chunk_objects)
+
+    # Core bulk insert (executemany), no ORM objects or identity map
+    await db.execute(insert(Chunk), rows)
     await db.commit()
-    
-    return [c.id for c in chunk_objects]
+
+    return [row["id"] for row in rows]
 
 
 async def get_chunk(db: AsyncSession, chunk_id: str):
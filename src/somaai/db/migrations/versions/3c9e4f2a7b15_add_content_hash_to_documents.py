@@ -0,0 +1,33 @@
+"""add content_hash to documents
+
+Revision ID: 3c9e4f2a7b15
+Revises: fd5cd1a7fa49
+Create Date: 2026-10-15 10:12:41.118204
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision: str = '3c9e4f2a7b15'
+down_revision: Union[str, None] = 'fd5cd1a7fa49'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('documents', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index(
+        'ix_documents_content_hash_grade_subject',
+        'documents',
+        ['content_hash', 'grade', 'subject'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_documents_content_hash_grade_subject', table_name='documents')
+    op.drop_column('documents', 'content_hash')
@@ -0,0 +1,40 @@
+"""add partial index for pending jobs
+
+Revision ID: 8b2d6e41c0a9
+Revises: 3c9e4f2a7b15
+Create Date: 2026-10-15 14:03:27.551870
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision: str = '8b2d6e41c0a9'
+down_revision: Union[str, None] = '3c9e4f2a7b15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_jobs_pending_created',
+            'jobs',
+            ['created_at'],
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True,
+            sqlite_where=sa.text("status = 'pending'"),
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_jobs_pending_created',
+            table_name='jobs',
+            postgresql_concurrently=True,
+        )
@@ -15,6 +15,7 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    text,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -57,15 +58,32 @@ class Document(Base):
     grade = Column(String(10), nullable=False, index=True)
     subject = Column(String(50), nullable=False, index=True)
     page_count = Column(Integer, default=0)
+    content_hash = Column(String(64), nullable=True)  # BLAKE2b of file content
     metadata_json = Column(JSON, nullable=True)
     uploaded_at = Column(DateTime, server_default=func.now())
     processed_at = Column(DateTime, nullable=True)
 
     # Relationships
     chunks = relationship(
-        "Chunk", back_populates="document", cascade="all, delete-orphan"
+        "Chunk",
+        back_populates="document",
+        cascade="all, delete-orphan",
+        order_by="Chunk.chunk_index",
     )
 
+    # Same content ingested once per grade/subject
+    __table_args__ = (
+        Index(
+            "ix_documents_content_hash_grade_subject",
+            "content_hash",
+            "grade",
+            "subject",
+            unique=True,
+        ),
+    )
+    # Fetch uploaded_at via INSERT ... RETURNING instead of a refresh
+    __mapper_args__ = {"eager_defaults": True}
+
 
 class Chunk(Base):
     """Document chunk for vector search.
@@ -289,3 +307,13 @@ class Job(Base):
     created_at = Column(DateTime, server_default=func.now())
     started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
+
+    # Worker polls only scan live work, not completed job history
+    __table_args__ = (
+        Index(
+            "ix_jobs_pending_created",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
+    )
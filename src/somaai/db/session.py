@@ -5,16 +5,42 @@ Supports both PostgreSQL (production) and SQLite (testing).
 """
 
 from collections.abc import AsyncGenerator
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from somaai.settings import settings
 
+
+def _engine_kwargs(url: str) -> dict[str, Any]:
+    """Pool and driver options for the configured database.
+
+    SQLite keeps SQLAlchemy's defaults; in-memory databases use a static
+    pool that takes no sizing arguments.
+    """
+    if not url.startswith("postgresql"):
+        return {}
+    kwargs: dict[str, Any] = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": False,
+    }
+    if "+asyncpg" in url:
+        # Cache prepared statements for the repeated CRUD queries
+        kwargs["connect_args"] = {
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+        }
+    return kwargs
+
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     future=True,
+    **_engine_kwargs(settings.database_url),
 )
 
 # Create async session factory
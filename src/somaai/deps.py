@@ -1,11 +1,20 @@
 """Dependency injection."""
 
-from fastapi import Header, Request
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
 
+import httpx
+from fastapi import Depends, Header, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+from somaai.modules.chat.service import ChatService
 from somaai.providers.llm import LLMClient
 from somaai.settings import Settings, settings
 from somaai.utils.ids import generate_short_id
 
+M = TypeVar("M", bound=BaseModel)
+
 
 def get_settings() -> Settings:
     """Get settings."""
@@ -17,6 +26,16 @@ def get_llm_dep(request: Request) -> LLMClient:
     return request.app.state.llm
 
 
+def get_http(request: Request) -> httpx.AsyncClient:
+    """Get the shared outbound HTTP client."""
+    return request.app.state.http
+
+
+def get_chat_service(http: httpx.AsyncClient = Depends(get_http)) -> ChatService:
+    """Get chat service bound to the shared HTTP client."""
+    return ChatService(http=http)
+
+
 def get_actor_id(x_actor_id: str | None = Header(None, alias="X-Actor-Id")) -> str:
     """Get actor ID from request header.
 
@@ -35,3 +54,62 @@ def get_actor_id(x_actor_id: str | None = Header(None, alias="X-Actor-Id")) -> s
     # Generate temporary ID if not provided
     # This allows API testing without frontend
     return f"anon_{generate_short_id()}"
+
+
+def json_body(model: type[M]) -> Callable[[Request], Awaitable[M]]:
+    """Build a dependency that parses a JSON body with model_validate_json.
+
+    FastAPI decodes bodies with json.loads and then validates the dict;
+    pydantic-core parses and validates the raw bytes in a single pass.
+    Pair with ``openapi_extra=json_body_openapi(model)`` on the route so
+    the request schema still appears in the docs.
+
+    Args:
+        model: Request body model
+
+    Returns:
+        Dependency returning the validated model
+    """
+
+    async def parse(request: Request) -> M:
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(
+                [
+                    {**error, "loc": ("body", *error["loc"])}
+                    for error in e.errors(include_url=False)
+                ]
+            ) from None
+
+    return parse
+
+
+def json_body_openapi(model: type[BaseModel]) -> dict[str, Any]:
+    """OpenAPI requestBody for routes using json_body.
+
+    Args:
+        model: Request body model
+
+    Returns:
+        Value for the route's openapi_extra
+    """
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref", "")
+            if ref.startswith("#/$defs/"):
+                return inline(defs[ref.removeprefix("#/$defs/")])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(item) for item in node]
+        return node
+
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": inline(schema)}},
+        }
+    }
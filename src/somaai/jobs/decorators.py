@@ -6,11 +6,15 @@ and database integration.
 
 from __future__ import annotations
 
+import asyncio
 import functools
 import logging
 from typing import Callable, ParamSpec, TypeVar
 
 from somaai.contracts.jobs import JobStatus
+from somaai.db import crud
+from somaai.db.session import async_session_maker
+from somaai.jobs.queue import get_progress_buffer
 
 logger = logging.getLogger(__name__)
 
@@ -43,38 +47,28 @@ def with_job_tracking(task_name: str) -> Callable[[Callable[P, R]], Callable[P,
                 # No job_id, just execute
                 return await func(*args, **kwargs)
             
-            from somaai.db.session import async_session_maker
-            from somaai.db import crud
-            
-            # Mark job as running
+            # One session for all transitions; it holds no connection
+            # between commits, so nothing is pinned while the task runs
             async with async_session_maker() as db:
                 await crud.update_job_status(
                     db, job_id, JobStatus.RUNNING.value, progress_pct=0
                 )
-            
-            logger.info(f"[{task_name}] Job {job_id} started")
-            
-            try:
-                result = await func(*args, **kwargs)
-                
-                # Mark job as completed
-                async with async_session_maker() as db:
+                logger.info(f"[{task_name}] Job {job_id} started")
+
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
                     await crud.update_job_status(
-                        db, job_id, JobStatus.COMPLETED.value, progress_pct=100
+                        db, job_id, JobStatus.FAILED.value, error=str(e)
                     )
-                
+                    logger.exception(f"[{task_name}] Job {job_id} failed: {e}")
+                    raise
+
+                await crud.update_job_status(
+                    db, job_id, JobStatus.COMPLETED.value, progress_pct=100
+                )
                 logger.info(f"[{task_name}] Job {job_id} completed")
                 return result
-                
-            except Exception as e:
-                # Mark job as failed
-                async with async_session_maker() as db:
-                    await crud.update_job_status(
-                        db, job_id, JobStatus.FAILED.value, error=str(e)
-                    )
-                
-                logger.exception(f"[{task_name}] Job {job_id} failed: {e}")
-                raise
         
         return wrapper
     return decorator
@@ -85,7 +79,8 @@ def with_progress_callback(
 ) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """Decorator that injects a database-backed progress callback.
     
-    Creates a sync-compatible progress callback that updates the database.
+    Creates a sync-compatible progress callback that updates the database
+    through the shared progress buffer.
     The callback is passed as 'progress_callback' kwarg to the decorated function.
     
     Usage:
@@ -108,25 +103,25 @@ def with_progress_callback(
             if not job_id:
                 return await func(*args, **kwargs)
             
+            progress = get_progress_buffer()
+            loop = asyncio.get_running_loop()
+
             def progress_callback(pct: int, stage: str = "") -> None:
-                """Sync progress callback that schedules DB update."""
-                import asyncio
-                from somaai.db.session import async_session_maker
-                from somaai.db import crud
-                
-                async def _update():
-                    async with async_session_maker() as db:
-                        await crud.update_job_progress(db, job_id, pct)
-                
-                try:
-                    loop = asyncio.get_running_loop()
-                    loop.create_task(_update())
-                except RuntimeError:
-                    # No running loop, skip update
-                    pass
+                """Sync progress callback that buffers a batched DB update.
+
+                Safe to call from worker threads; the tick is handed to
+                the event loop.
+                """
+                loop.call_soon_threadsafe(progress.update, job_id, pct)
             
             kwargs["progress_callback"] = progress_callback
-            return await func(*args, **kwargs)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                # Let handed-off ticks land, then write the last one rather
+                # than waiting for the timer
+                await asyncio.sleep(0)
+                await progress.flush()
         
         return wrapper
     return decorator
@@ -6,53 +6,128 @@ Uses database for persistent job storage.
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import logging
+import pickle
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from somaai.contracts.jobs import JobResponse, JobStatus
 from somaai.db import crud
 from somaai.db.session import async_session_maker
+from somaai.settings import settings
 from somaai.utils.ids import generate_id
+from somaai.utils.redis import parse_redis_url
+from somaai.utils.serialization import json_dumps, json_loads
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
-async def get_redis_pool():
-    """Get ARQ Redis connection pool.
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def get_redis_settings():
+    """Get ARQ Redis settings for the jobs database.
+
+    Parsed once per process; shared by the enqueue path and the worker.
 
     Returns:
-        ARQ Redis pool
+        ARQ RedisSettings
     """
     try:
-        from arq import create_pool
         from arq.connections import RedisSettings
-
-        from somaai.settings import settings
-
-        # Parse Redis URL for jobs database
-        redis_url = settings.redis_jobs_url
-        if "://" in redis_url:
-            # Format: redis://host:port/db
-            parts = redis_url.split("://")[1]
-            host_port = parts.split("/")[0]
-            host = host_port.split(":")[0]
-            port = int(host_port.split(":")[1]) if ":" in host_port else 6379
-            db = int(parts.split("/")[1]) if "/" in parts else 1
-        else:
-            host, port, db = "localhost", 6379, 1
-
-        return await create_pool(RedisSettings(
-            host=host,
-            port=port,
-            database=db,
-            password=settings.redis_password or None,
-        ))
     except ImportError:
         raise ImportError(
             "arq is required for job queue. Install with: uv add arq"
         )
 
+    host, port, db, password = parse_redis_url(settings.redis_jobs_url, default_db=1)
+
+    return RedisSettings(
+        host=host,
+        port=port,
+        database=db,
+        password=password or settings.redis_password or None,
+    )
+
+
+# First byte of any pickle at protocol 2 or later; JSON never starts with it
+_PICKLE_PREFIX = b"\x80"
+
+
+def job_dumps(data: dict[str, Any]) -> bytes | str:
+    """Serialize an ARQ job or result record.
+
+    Job payloads and task results are plain dicts and go out as JSON.
+    A failed job's result is the raised exception, which JSON cannot
+    hold, so those records fall back to pickle.
+
+    Args:
+        data: Record built by ARQ
+
+    Returns:
+        Encoded record
+    """
+    try:
+        return json_dumps(data)
+    except (TypeError, ValueError):
+        return pickle.dumps(data)
+
+
+def job_loads(data: bytes) -> dict[str, Any]:
+    """Deserialize a record written by job_dumps or by ARQ's pickle default.
+
+    Reading pickles as well means jobs queued before the switch to JSON
+    still run, so the queue need not be drained on deploy.
+
+    Args:
+        data: Encoded record from Redis
+
+    Returns:
+        Decoded record
+    """
+    if data[:1] == _PICKLE_PREFIX:
+        return pickle.loads(data)
+    return json_loads(data)
+
+
+_redis_pool = None
+_redis_pool_lock = asyncio.Lock()
+
+
+async def get_redis_pool():
+    """Get singleton ARQ Redis connection pool.
+
+    Returns:
+        ARQ Redis pool
+    """
+    global _redis_pool
+    if _redis_pool is None:
+        async with _redis_pool_lock:
+            if _redis_pool is None:
+                from arq import create_pool
+
+                _redis_pool = await create_pool(
+                    get_redis_settings(),
+                    job_serializer=job_dumps,
+                    job_deserializer=job_loads,
+                )
+    return _redis_pool
+
+
+async def close_redis_pool() -> None:
+    """Close the ARQ Redis pool if it was created."""
+    global _redis_pool
+    if _redis_pool is not None:
+        await _redis_pool.aclose()
+        _redis_pool = None
+
 
 async def enqueue_job(
     task_name: str,
     payload: dict[str, Any],
+    db: AsyncSession | None = None,
 ) -> str:
     """Enqueue a background job.
 
@@ -62,48 +137,164 @@ async def enqueue_job(
         task_name: Name of the task to execute
             (e.g., 'ingest_document', 'generate_quiz')
         payload: Task-specific payload data
+        db: Optional session with pending changes; the job record is
+            committed together with them in one transaction before the
+            job is dispatched
 
     Returns:
         job_id: Unique job identifier for tracking
     """
-    from somaai.settings import settings
-
     job_id = generate_id()
 
     # Create job record in database
-    async with async_session_maker() as db:
-        await crud.create_job(db, job_id, task_name, payload)
+    if db is not None:
+        await crud.create_job(db, job_id, task_name, payload, commit=False)
+        await db.commit()
+    else:
+        async with async_session_maker() as session:
+            await crud.create_job(session, job_id, task_name, payload)
+
+    await _dispatch_job(job_id, task_name, payload)
+    return job_id
+
 
+async def _dispatch_job(job_id: str, task_name: str, payload: dict[str, Any]) -> None:
+    """Run or enqueue a job whose record is already committed.
+
+    Args:
+        job_id: Job identifier
+        task_name: Name of the task to execute
+        payload: Task-specific payload data
+    """
     if settings.queue_backend == "sync":
         # Sync mode: Execute immediately
         from somaai.jobs.tasks import TASK_REGISTRY
         task_fn = TASK_REGISTRY.get(task_name)
         if task_fn:
+            # Tasks record their own RUNNING/COMPLETED/FAILED transitions
+            # (including result_id), as they do under the ARQ worker
             try:
-                async with async_session_maker() as db:
-                    await crud.update_job_status(
-                        db, job_id, JobStatus.RUNNING.value, progress_pct=0
-                    )
                 await task_fn(job_id, **payload)
-                async with async_session_maker() as db:
-                    await crud.update_job_status(
-                        db, job_id, JobStatus.COMPLETED.value, progress_pct=100
-                    )
             except Exception as e:
-                async with async_session_maker() as db:
-                    await crud.update_job_status(
-                        db, job_id, JobStatus.FAILED.value, error=str(e)
-                    )
+                logger.error(f"Job {job_id} ({task_name}) failed: {e}")
     else:
-        # Redis mode: Enqueue with ARQ
-        pool = await get_redis_pool()
-        await pool.enqueue_job(
-            task_name,
-            job_id=job_id,
-            **payload,
-        )
+        # Redis mode: Enqueue with ARQ, coalesced with concurrent enqueues
+        await get_job_batcher().submit(job_id, task_name, payload)
+
+
+class JobBatcher:
+    """Coalesce concurrent ARQ enqueues into one flush.
+
+    Jobs submitted within ``max_wait`` seconds of each other (up to
+    ``max_batch``) are enqueued together through ``ArqRedis.enqueue_job``
+    on the shared pool, so a burst of uploads overlaps its round-trips
+    while keeping ARQ's atomic, uniqueness-checked writes.
+    """
+
+    def __init__(self, max_batch: int = 32, max_wait: float = 0.005):
+        """Initialize job batcher.
+
+        Args:
+            max_batch: Maximum jobs written per pipeline
+            max_wait: Seconds to wait for more jobs before flushing
+        """
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+
+    async def submit(
+        self, job_id: str, task_name: str, payload: dict[str, Any]
+    ) -> None:
+        """Queue a job for the next batch and wait until it is written.
+
+        Args:
+            job_id: Job identifier, also used as the ARQ job ID
+            task_name: Name of the task to execute
+            payload: Task-specific payload data
+
+        Raises:
+            Exception: Whatever ARQ raised while enqueueing this job
+        """
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((job_id, task_name, payload, future))
+        await future
+
+    async def close(self) -> None:
+        """Stop the consumer task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        """Collect jobs into batches and flush them until cancelled."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            self._drain(batch)
+            if len(batch) < self.max_batch:
+                await asyncio.sleep(self.max_wait)
+                self._drain(batch)
+
+            await self._flush(batch)
+
+    def _drain(self, batch: list) -> None:
+        """Move waiting jobs into batch without blocking."""
+        while len(batch) < self.max_batch and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+    async def _flush(self, batch: list) -> None:
+        """Enqueue a batch of jobs concurrently and resolve each caller."""
+        try:
+            pool = await get_redis_pool()
+        except Exception as e:
+            results: list[Any] = [e] * len(batch)
+        else:
+            results = await asyncio.gather(
+                *(
+                    pool.enqueue_job(
+                        task_name, _job_id=job_id, job_id=job_id, **payload
+                    )
+                    for job_id, task_name, payload, _ in batch
+                ),
+                return_exceptions=True,
+            )
+
+        for (job_id, task_name, _, future), result in zip(batch, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to enqueue job {job_id} ({task_name}): {result}")
+                if not future.done():
+                    future.set_exception(result)
+                continue
+            if result is None:
+                logger.warning(f"Job {job_id} was already queued in ARQ")
+            if not future.done():
+                future.set_result(None)
 
-    return job_id
+
+_job_batcher: JobBatcher | None = None
+
+
+def get_job_batcher() -> JobBatcher:
+    """Get singleton job batcher instance."""
+    global _job_batcher
+    if _job_batcher is None:
+        _job_batcher = JobBatcher()
+    return _job_batcher
+
+
+async def close_job_batcher() -> None:
+    """Stop the job batcher if it was started."""
+    if _job_batcher is not None:
+        await _job_batcher.close()
 
 
 async def get_job_status(job_id: str) -> JobResponse | None:
@@ -122,12 +313,45 @@ async def get_job_status(job_id: str) -> JobResponse | None:
     if not job:
         return None
 
-    return JobResponse(
+    return _to_job_response(job)
+
+
+async def get_jobs_status_bulk(job_ids: list[str]) -> list[JobResponse]:
+    """Get current status of several jobs with one query.
+
+    Args:
+        job_ids: Job identifiers from enqueue_job
+
+    Returns:
+        JobResponses in the order of job_ids; unknown IDs are skipped
+    """
+    async with async_session_maker() as db:
+        jobs = {job.id: job for job in await crud.get_jobs(db, job_ids)}
+
+    return [_to_job_response(jobs[job_id]) for job_id in job_ids if job_id in jobs]
+
+
+def _to_job_response(job) -> JobResponse:
+    """Convert a Job row to JobResponse without re-validation.
+
+    Job rows were validated when written, so model_construct is safe and
+    keeps status polling cheap.
+
+    Args:
+        job: Job model instance
+
+    Returns:
+        JobResponse schema
+    """
+    return JobResponse.model_construct(
         job_id=job.id,
         status=JobStatus(job.status),
         progress_pct=job.progress_pct or 0,
         result_id=job.result_id,
         error=job.error,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        completed_at=job.completed_at,
     )
 
 
@@ -137,6 +361,7 @@ async def update_job_status(
     progress_pct: int = 0,
     result_id: str | None = None,
     error: str | None = None,
+    db: AsyncSession | None = None,
 ) -> None:
     """Update job status (called by workers).
 
@@ -146,7 +371,18 @@ async def update_job_status(
         progress_pct: Progress percentage (0-100)
         result_id: Result ID if completed (e.g., doc_id, quiz_id)
         error: Error message if failed
+        db: Optional session with pending changes; the status is
+            committed together with them in one transaction
     """
+    # The status write carries its own progress; drop any buffered tick
+    get_progress_buffer().discard(job_id)
+    if db is not None:
+        await crud.update_job_status(
+            db, job_id, status.value, progress_pct, result_id, error, commit=False
+        )
+        await db.commit()
+        return
+
     async with async_session_maker() as db:
         await crud.update_job_status(
             db, job_id, status.value, progress_pct, result_id, error
@@ -156,13 +392,88 @@ async def update_job_status(
 async def update_job_progress(job_id: str, progress_pct: int, stage: str = "") -> None:
     """Update job progress (convenience function).
 
+    Progress is buffered and written in batches; see ProgressBuffer.
+
     Args:
         job_id: Job identifier
         progress_pct: Progress percentage (0-100)
         stage: Current stage description (not stored)
     """
-    async with async_session_maker() as db:
-        await crud.update_job_progress(db, job_id, progress_pct)
+    get_progress_buffer().update(job_id, progress_pct)
+
+
+class ProgressBuffer:
+    """Coalesce job progress ticks into periodic batched writes.
+
+    Pipelines report progress far more often than anyone polls for it.
+    Only the latest value per job is kept, ticks repeating the last
+    written value are dropped, and all pending jobs are
+    written with one executemany UPDATE at most every ``flush_interval``
+    seconds instead of one session and commit per tick.
+    """
+
+    def __init__(self, flush_interval: float = 0.25):
+        """Initialize progress buffer.
+
+        Args:
+            flush_interval: Seconds to collect ticks before writing
+        """
+        self.flush_interval = flush_interval
+        self._pending: dict[str, int] = {}
+        # Last value written per running job, to skip unchanged ticks
+        self._written: dict[str, int] = {}
+        self._flush_task: asyncio.Task | None = None
+
+    def update(self, job_id: str, progress_pct: int) -> None:
+        """Record a progress tick; safe to call from sync callbacks.
+
+        Args:
+            job_id: Job identifier
+            progress_pct: Progress percentage (0-100)
+        """
+        if self._written.get(job_id) == progress_pct:
+            self._pending.pop(job_id, None)
+            return
+        self._pending[job_id] = progress_pct
+        if self._flush_task is None or self._flush_task.done():
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return  # No running loop; picked up by the next flush
+            self._flush_task = loop.create_task(self._flush_later())
+
+    def discard(self, job_id: str) -> None:
+        """Forget any buffered progress for a job."""
+        self._pending.pop(job_id, None)
+        self._written.pop(job_id, None)
+
+    async def flush(self) -> None:
+        """Write all buffered progress now."""
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        try:
+            async with async_session_maker() as db:
+                await crud.update_jobs_progress(db, pending)
+        except Exception as e:
+            logger.warning(f"Failed to write progress for {len(pending)} jobs: {e}")
+        else:
+            self._written.update(pending)
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+
+_progress_buffer: ProgressBuffer | None = None
+
+
+def get_progress_buffer() -> ProgressBuffer:
+    """Get singleton progress buffer instance."""
+    global _progress_buffer
+    if _progress_buffer is None:
+        _progress_buffer = ProgressBuffer()
+    return _progress_buffer
 
 
 async def get_pending_jobs(limit: int = 10) -> list:
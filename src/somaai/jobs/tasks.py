@@ -6,10 +6,35 @@ Tasks are executed by the worker process.
 
 from __future__ import annotations
 
+import asyncio
+from functools import lru_cache
 from typing import Any
 
 from somaai.contracts.jobs import JobStatus
-from somaai.jobs.queue import update_job_progress, update_job_status
+from somaai.db import crud
+from somaai.db.session import async_session_maker
+from somaai.jobs.queue import (
+    get_progress_buffer,
+    update_job_progress,
+    update_job_status,
+)
+from somaai.settings import settings
+
+
+@lru_cache(maxsize=1)
+def _get_pipeline():
+    """Get the worker's ingest pipeline, reusing its store and splitter."""
+    from somaai.modules.ingest.pipeline import IngestPipeline
+
+    return IngestPipeline(settings)
+
+
+@lru_cache(maxsize=1)
+def _get_quiz_generator():
+    """Get the worker's quiz generator."""
+    from somaai.modules.quiz.generator import QuizGenerator
+
+    return QuizGenerator()
 
 
 async def ingest_document_task(
@@ -40,25 +65,20 @@ async def ingest_document_task(
         subject: Subject
         title: Optional document title
     """
-    import asyncio
-    from somaai.modules.ingest.pipeline import IngestPipeline
-    from somaai.db.session import async_session_maker
-    from somaai.db import crud
-    from somaai.settings import settings
 
     try:
         await update_job_status(job_id, JobStatus.RUNNING)
 
-        pipeline = IngestPipeline(settings)
+        pipeline = _get_pipeline()
+
+        progress = get_progress_buffer()
+        loop = asyncio.get_running_loop()
 
-        # Sync-compatible progress callback that schedules async DB updates
+        # Sync-compatible progress callback; ticks are batched into DB writes.
+        # Hand off via the loop so stages run in worker threads report too.
         def on_progress(stage: str, pct: int) -> None:
-            """Sync progress callback - schedules async update."""
-            try:
-                loop = asyncio.get_running_loop()
-                loop.create_task(update_job_progress(job_id, pct, stage))
-            except RuntimeError:
-                pass  # No running loop, skip progress update
+            """Sync progress callback - buffers the update."""
+            loop.call_soon_threadsafe(progress.update, job_id, pct)
 
         result = await pipeline.run(
             doc_id=doc_id,
@@ -72,14 +92,14 @@ async def ingest_document_task(
         # Update document with processing results
         page_count = result.get("pages", 0) if isinstance(result, dict) else 0
         async with async_session_maker() as db:
-            await crud.update_document_processed(db, doc_id, page_count)
-
-        await update_job_status(
-            job_id,
-            JobStatus.COMPLETED,
-            progress_pct=100,
-            result_id=doc_id,
-        )
+            await crud.update_document_processed(db, doc_id, page_count, commit=False)
+            await update_job_status(
+                job_id,
+                JobStatus.COMPLETED,
+                progress_pct=100,
+                result_id=doc_id,
+                db=db,
+            )
 
     except Exception as e:
         await update_job_status(
@@ -123,13 +143,11 @@ async def generate_quiz_task(
         num_questions: Number of questions to generate
         include_answer_key: Include answers with citations
     """
-    from somaai.modules.quiz.generator import QuizGenerator
-
     try:
         await update_job_status(job_id, JobStatus.RUNNING)
         await update_job_progress(job_id, 10, "Loading topics")
 
-        generator = QuizGenerator()
+        generator = _get_quiz_generator()
 
         await update_job_progress(job_id, 30, "Generating questions")
 
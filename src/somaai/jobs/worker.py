@@ -13,9 +13,21 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
+from sqlalchemy import text
+
+from somaai.db.session import close_db, engine
+from somaai.jobs.queue import (
+    get_progress_buffer,
+    get_redis_settings,
+    job_dumps,
+    job_loads,
+)
+from somaai.jobs.tasks import generate_quiz_task, ingest_document_task
+
 if TYPE_CHECKING:
     pass
 
@@ -26,43 +38,39 @@ logger = logging.getLogger(__name__)
 # Task functions must be top-level coroutines for arq
 async def ingest_document(ctx: dict, job_id: str, **kwargs) -> dict:
     """Document ingestion task wrapper."""
-    from somaai.jobs.tasks import ingest_document_task
     await ingest_document_task(job_id=job_id, **kwargs)
     return {"status": "completed"}
 
 
 async def generate_quiz(ctx: dict, job_id: str, **kwargs) -> dict:
     """Quiz generation task wrapper."""
-    from somaai.jobs.tasks import generate_quiz_task
     await generate_quiz_task(job_id=job_id, **kwargs)
     return {"status": "completed"}
 
 
-def _get_redis_settings():
-    """Get Redis settings for ARQ worker.
-    
-    Must be called at class definition time to set the class attribute.
+async def startup(ctx: dict) -> None:
+    """Open DB connections before the first job arrives.
+
+    Connects max_jobs connections concurrently so the first burst of
+    jobs does not pay connection setup one by one.
     """
-    from arq.connections import RedisSettings
-    from somaai.settings import settings
-
-    # Parse Redis URL for jobs database
-    redis_url = settings.redis_jobs_url
-    if "://" in redis_url:
-        parts = redis_url.split("://")[1]
-        host_port = parts.split("/")[0]
-        host = host_port.split(":")[0]
-        port = int(host_port.split(":")[1]) if ":" in host_port else 6379
-        db = int(parts.split("/")[1]) if "/" in parts else 1
-    else:
-        host, port, db = "localhost", 6379, 1
-
-    return RedisSettings(
-        host=host,
-        port=port,
-        database=db,
-        password=settings.redis_password or None,
-    )
+    async def warm_connection() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    try:
+        await asyncio.gather(
+            *(warm_connection() for _ in range(WorkerSettings.max_jobs))
+        )
+        logger.info(f"Warmed {WorkerSettings.max_jobs} DB connections")
+    except Exception as e:
+        logger.warning(f"DB pool warm-up failed: {e}")
+
+
+async def shutdown(ctx: dict) -> None:
+    """Write buffered progress and close DB connections."""
+    await get_progress_buffer().flush()
+    await close_db()
 
 
 class WorkerSettings:
@@ -74,11 +82,15 @@ class WorkerSettings:
 
     # Redis settings - must be a class attribute, not a method
     # ARQ accesses this directly as WorkerSettings.redis_settings.host
-    redis_settings = _get_redis_settings()
+    redis_settings = get_redis_settings()
 
     # Register task functions
     functions = [ingest_document, generate_quiz]
 
+    # JSON, with pickle for failed results; must match the enqueue pool
+    job_serializer = job_dumps
+    job_deserializer = job_loads
+
     # Retry configuration
     max_tries = 3
     job_timeout = 3600  # 1 hour max per job
@@ -89,6 +101,10 @@ class WorkerSettings:
     # Health check
     health_check_interval = 30
 
+    # Lifecycle hooks
+    on_startup = startup
+    on_shutdown = shutdown
+
 
 def run_worker() -> None:
     """Entry point for running the worker.
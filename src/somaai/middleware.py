@@ -1,9 +1,14 @@
 """Application middleware."""
 
 import logging
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from somaai.api.security import get_client_id, get_redis_rate_limiter
+from somaai.settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -19,37 +24,57 @@ def setup_middleware(app: FastAPI) -> None:
         allow_headers=["*"],
     )
 
-    # Rate limiting with slowapi (Redis-backed for horizontal scaling)
-    try:
-        from slowapi import Limiter, _rate_limit_exceeded_handler
-        from slowapi.util import get_remote_address
-        from slowapi.errors import RateLimitExceeded
-        from slowapi.middleware import SlowAPIMiddleware
-
-        # Try to use Redis storage for distributed rate limiting
-        try:
-            from somaai.settings import settings
-            from slowapi.extension import LimiterMiddlewareWithStorage
-            
-            # Redis-backed storage for horizontal scaling
-            limiter = Limiter(
-                key_func=get_remote_address,
-                storage_uri=settings.redis_url,
-                default_limits=["200/minute"],
-            )
-            logger.info("Rate limiting enabled with Redis storage")
-        except Exception as e:
-            # Fallback to in-memory if Redis unavailable
-            limiter = Limiter(
-                key_func=get_remote_address,
-                default_limits=["200/minute"],
-            )
-            logger.warning(f"Rate limiting using in-memory storage: {e}")
+    # App-wide default limit, Redis-backed for horizontal scaling
+    if not settings.rate_limit_disabled:
+        app.add_middleware(RateLimitMiddleware, limit=200, window_seconds=60)
+
 
-        app.state.limiter = limiter
-        app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-        app.add_middleware(SlowAPIMiddleware)
+class RateLimitMiddleware:
+    """Apply a default per-client rate limit to every HTTP request.
 
-    except ImportError:
-        logger.info("slowapi not installed, rate limiting disabled")
+    Uses the shared RedisRateLimiter, so each request costs one Lua call
+    over its dedicated Redis pool. Counts are kept under a "global:" prefix
+    so they don't mix with per-endpoint @rate_limit budgets.
+    """
+
+    def __init__(self, app: ASGIApp, limit: int, window_seconds: int = 60):
+        """Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            limit: Maximum requests per window per client
+            window_seconds: Window size in seconds
+        """
+        self.app = app
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.limiter = get_redis_rate_limiter()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client_id = get_client_id(Request(scope))
+        allowed, _ = await self.limiter.is_allowed(
+            f"global:{client_id}", self.limit, self.window_seconds
+        )
+        if not allowed:
+            response = JSONResponse(
+                {
+                    "detail": (
+                        f"Rate limit exceeded. Try again in "
+                        f"{self.window_seconds} seconds."
+                    )
+                },
+                status_code=429,
+                headers={
+                    "Retry-After": str(self.window_seconds),
+                    "X-RateLimit-Limit": str(self.limit),
+                    "X-RateLimit-Remaining": "0",
+                },
+            )
+            await response(scope, receive, send)
+            return
 
+        await self.app(scope, receive, send)
@@ -6,9 +6,10 @@ persisting them with messages, and retrieving them later.
 
 from __future__ import annotations
 
+import heapq
 from typing import TYPE_CHECKING
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
 
 from somaai.contracts.chat import CitationResponse
 from somaai.db.models import Chunk, Document, MessageCitation
@@ -56,37 +57,27 @@ class CitationExtractor:
                 - List of CitationResponse objects
                 - chunks_map: Dict mapping "doc_id:page" -> chunk_id for persistence
         """
-        citations = []
-        chunks_map = {}  # For linking back to chunk_id during save
-        seen = set()
-
-        # Sort by score descending
-        sorted_chunks = sorted(
-            chunks,
-            key=lambda x: float(x.get("rerank_score", x.get("score", 0))),
-            reverse=True
-        )
+        # Keep the best-scoring chunk per doc_id + page, then take the top_k
+        # of those; ties keep input order, as a stable sort would
+        best: dict[tuple, tuple[float, int, dict]] = {}
+        for i, doc in enumerate(chunks):
+            meta = doc.get("metadata", {})
+            key = (meta.get("doc_id", "unknown"), meta.get("page_start", 1))
+            score = float(doc.get("rerank_score", doc.get("score", 0)))
+            if key not in best or score > best[key][0]:
+                best[key] = (score, i, doc)
 
-        for doc in sorted_chunks:
-            if len(citations) >= top_k:
-                break
+        top = heapq.nlargest(top_k, best.items(), key=lambda kv: (kv[1][0], -kv[1][1]))
 
+        citations = []
+        chunks_map = {}  # For linking back to chunk_id during save
+        for (doc_id, page), (score, _, doc) in top:
             meta = doc.get("metadata", {})
-            doc_id = meta.get("doc_id", "unknown")
-            page = meta.get("page_start", 1)
-            chunk_id = meta.get("chunk_id")
 
-            # Deduplicate by doc_id + page
-            key = f"{doc_id}:{page}"
-            if key in seen:
-                continue
-            seen.add(key)
-
-            # Track chunk_id for persistence
+            # Track chunk_id for persistence; only kept keys are formatted
+            chunk_id = meta.get("chunk_id")
             if chunk_id:
-                chunks_map[key] = chunk_id
-
-            score = float(doc.get("rerank_score", doc.get("score", 0)))
+                chunks_map[f"{doc_id}:{page}"] = chunk_id
 
             citations.append(CitationResponse(
                 doc_id=doc_id,
@@ -117,29 +108,39 @@ class CitationExtractor:
         Returns:
             Citations associated with the message, ordered by relevance
         """
+        # Project only the columns CitationResponse needs; the preview falls
+        # back to the chunk text in SQL so full chunk content isn't fetched
         stmt = (
-            select(MessageCitation, Chunk, Document)
+            select(
+                Chunk.document_id,
+                Document.title,
+                Chunk.page_start,
+                Chunk.page_end,
+                func.coalesce(
+                    func.nullif(MessageCitation.snippet, ""),
+                    func.substr(Chunk.content, 1, 200),
+                ),
+                MessageCitation.relevance_score,
+            )
             .join(Chunk, MessageCitation.chunk_id == Chunk.id)
             .join(Document, Chunk.document_id == Document.id)
             .where(MessageCitation.message_id == message_id)
             .order_by(MessageCitation.order)
         )
         result = await db.execute(stmt)
-        rows = result.all()
-
-        citations = []
-        for citation, chunk, doc in rows:
-            citations.append(CitationResponse(
-                doc_id=chunk.document_id,
-                doc_title=doc.title,
-                page_start=chunk.page_start,
-                page_end=chunk.page_end,
-                chunk_preview=citation.snippet or chunk.content[:200],
-                view_url=self._format_view_url(chunk.document_id, chunk.page_start),
-                relevance_score=citation.relevance_score or 0.0,
-            ))
 
-        return citations
+        return [
+            CitationResponse(
+                doc_id=doc_id,
+                doc_title=title,
+                page_start=page_start,
+                page_end=page_end,
+                chunk_preview=preview,
+                view_url=self._format_view_url(doc_id, page_start),
+                relevance_score=score or 0.0,
+            )
+            for doc_id, title, page_start, page_end, preview, score in result
+        ]
 
     async def save_citations(
         self,
@@ -150,8 +151,8 @@ class CitationExtractor:
     ) -> None:
         """Persist citations for a message.
 
-        Note: This method adds to the session but does NOT commit.
-        The caller is responsible for committing the transaction.
+        Note: This method writes in the caller's transaction but does NOT
+        commit. The caller is responsible for committing the transaction.
 
         Args:
             db: Database session
@@ -159,23 +160,29 @@ class CitationExtractor:
             citations: CitationResponse objects from extract_citations
             chunks_map: Mapping from extract_citations ("doc_id:page" -> chunk_id)
         """
+        rows = []
         for i, cit in enumerate(citations):
-            key = f"{cit.doc_id}:{cit.page_start}"
-            chunk_id = chunks_map.get(key)
-
+            chunk_id = chunks_map.get(f"{cit.doc_id}:{cit.page_start}")
             if not chunk_id:
                 # Skip citations we can't link to a chunk
                 continue
-
-            db_citation = MessageCitation(
-                id=generate_id(),
-                message_id=message_id,
-                chunk_id=chunk_id,
-                relevance_score=cit.relevance_score,
-                order=i,
-                snippet=cit.chunk_preview,
+            rows.append(
+                {
+                    "id": generate_id(),
+                    "message_id": message_id,
+                    "chunk_id": chunk_id,
+                    "relevance_score": cit.relevance_score,
+                    "order": i,
+                    "snippet": cit.chunk_preview,
+                }
             )
-            db.add(db_citation)
+        if not rows:
+            return
+
+        # Write a pending parent message first, then all citations in one
+        # executemany instead of one ORM object and INSERT per citation
+        await db.flush()
+        await db.execute(insert(MessageCitation), rows)
 
     def _format_view_url(self, doc_id: str, page_number: int) -> str:
         """Generate stable view URL for a citation."""
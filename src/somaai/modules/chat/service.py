@@ -1,9 +1,24 @@
 """Chat module service."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+
 
 class ChatService:
     """Chat service."""
 
+    def __init__(self, http: httpx.AsyncClient | None = None):
+        """Initialize chat service.
+
+        Args:
+            http: Shared outbound HTTP client for provider calls
+        """
+        self.http = http
+
     async def process_message(self, message: str) -> str:
         """Process a chat message."""
         return f"Response to: {message}"
@@ -121,13 +121,14 @@ class FeedbackService:
         Returns:
             FeedbackResponse schema
         """
-        return FeedbackResponse(
+        # Stored rows were validated on write; skip re-validation
+        return FeedbackResponse.model_construct(
             feedback_id=cast(str, feedback.id),
             message_id=cast(str, feedback.message_id),
             useful=cast(bool, feedback.useful),
             text=cast(str | None, feedback.text),
             tags=cast(list[str] | None, feedback.tags),
-            created_at=feedback.created_at,  # type: ignore[arg-type]
+            created_at=feedback.created_at,
             user_role=user_role,
         )
 
@@ -318,6 +318,62 @@ class QdrantStore(VectorStore):
             for doc, score in docs
         ]
 
+    async def search_batch(
+        self,
+        queries: list[str],
+        top_k: int = 10,
+        grade: str | None = None,
+        subject: str | None = None,
+    ) -> list[list[dict]]:
+        """Search for several queries with one embedding call and one Qdrant call.
+
+        Args:
+            queries: Search queries
+            top_k: Number of results per query
+            grade: Grade filter applied to every query
+            subject: Subject filter applied to every query
+
+        Returns:
+            One list of documents with scores per query, in query order
+        """
+        from qdrant_client.models import QueryRequest
+
+        if not queries:
+            return []
+
+        must = [
+            FieldCondition(key=f"metadata.{key}", match=MatchValue(value=value))
+            for key, value in (("grade", grade), ("subject", subject))
+            if value
+        ]
+        query_filter = Filter(must=must) if must else None
+
+        vectors = await self.embeddings.aembed_documents(queries)
+        responses = self.client.query_batch_points(
+            collection_name=self.settings.qdrant_collection_name,
+            requests=[
+                QueryRequest(
+                    query=vector,
+                    filter=query_filter,
+                    limit=top_k,
+                    with_payload=True,
+                )
+                for vector in vectors
+            ],
+        )
+
+        return [
+            [
+                {
+                    "content": (point.payload or {}).get("page_content", ""),
+                    "metadata": (point.payload or {}).get("metadata", {}),
+                    "score": point.score,
+                }
+                for point in response.points
+            ]
+            for response in responses
+        ]
+
     async def delete(self, ids: list[str]) -> None:
         """Delete documents by ID."""
         await self.store.adelete(ids)
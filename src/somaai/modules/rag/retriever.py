@@ -101,6 +101,51 @@ class Retriever:
             logger.error(f"Retrieval failed: {e}")
             return []
 
+    async def retrieve_batch(
+        self,
+        queries: list[str],
+        top_k: int = 15,
+        grade: str | None = None,
+        subject: str | None = None,
+    ) -> list[list[dict]]:
+        """Retrieve documents for several queries in one vector search.
+
+        Args:
+            queries: User questions sharing the same filters
+            top_k: Number of documents per query
+            grade: Filter by grade level
+            subject: Filter by subject
+
+        Returns:
+            One list of documents per query, in query order
+        """
+        start_time = time.time()
+
+        try:
+            results = await self.store.search_batch(
+                queries=queries,
+                top_k=top_k,
+                grade=grade,
+                subject=subject,
+            )
+
+            latency_ms = (time.time() - start_time) * 1000
+            logger.info(
+                "retrieval_batch",
+                extra={
+                    "batch_size": len(queries),
+                    "latency_ms": latency_ms,
+                    "grade": grade,
+                    "subject": subject,
+                },
+            )
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Batch retrieval failed: {e}")
+            return [[] for _ in queries]
+
     async def retrieve_with_fallback(
         self,
         query: str,
@@ -0,0 +1,20 @@
+"""Shared outbound HTTP client."""
+
+from __future__ import annotations
+
+import httpx
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client shared by the app.
+
+    One client per process keeps connections to embedding/LLM providers
+    alive between requests instead of paying a TCP+TLS handshake each time.
+
+    Returns:
+        AsyncClient with keep-alive pooling
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    )
@@ -4,6 +4,7 @@ Provides unified interface for file storage with multiple backend support.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable
 from typing import BinaryIO
 
 
@@ -26,6 +27,22 @@ class StorageBackend(ABC):
         """
         pass
 
+    async def save_stream(self, chunks: AsyncIterable[bytes], path: str) -> str:
+        """Save a file to storage from a stream of chunks.
+
+        Backends should override this to write chunks as they arrive;
+        the default buffers the stream and delegates to save.
+
+        Args:
+            chunks: Async iterable of file content chunks
+            path: Destination path/key
+
+        Returns:
+            Full storage path/URL of saved file
+        """
+        content = b"".join([chunk async for chunk in chunks])
+        return await self.save(content, path)
+
     @abstractmethod
     async def get(self, path: str) -> bytes | None:
         """Retrieve file content from storage.
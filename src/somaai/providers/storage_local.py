@@ -6,6 +6,7 @@ and safe file handling using utility functions.
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterable
 from pathlib import Path
 from typing import BinaryIO
 
@@ -16,6 +17,7 @@ from somaai.utils.files import (
     async_file_exists,
     async_read_file,
     async_safe_write,
+    async_safe_write_stream,
     async_write_file,
     compute_file_hash,
     file_exists,
@@ -94,6 +96,23 @@ class LocalStorage(StorageBackend):
 
         return str(full_path)
 
+    async def save_stream(self, chunks: AsyncIterable[bytes], path: str) -> str:
+        """Save a file to local storage chunk by chunk.
+
+        Writes atomically (temp file then move); the content is never
+        buffered in full.
+
+        Args:
+            chunks: Async iterable of file content chunks
+            path: Relative destination path
+
+        Returns:
+            Full filesystem path of saved file
+        """
+        full_path = self._full_path(path)
+        await async_safe_write_stream(full_path, chunks)
+        return str(full_path)
+
     async def save_with_hash(
         self,
         file: bytes | BinaryIO,
@@ -26,6 +26,10 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite+aiosqlite:///./somaai.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 1800  # Seconds before a pooled connection is replaced
+    db_statement_cache_size: int = 1024  # asyncpg; set 0 behind pgbouncer
 
     # Redis / Cache
     redis_url: str = "redis://localhost:6379/0"  # General
@@ -73,6 +77,7 @@ class Settings(BaseSettings):
     
     # Security
     require_api_key: bool = False  # Enable in production
+    rate_limit_disabled: bool = False  # Skip @rate_limit wrappers entirely
 
 
 settings = Settings()
@@ -2,6 +2,23 @@
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from somaai.db import crud
+from somaai.db.base import Base
+from somaai.db.models import Message, MessageCitation
+from somaai.modules.chat.citations import CitationExtractor
+
+
+@pytest.fixture
+async def db():
+    """In-memory SQLite session with all tables created."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
 
 
 class TestChatEndpoints:
@@ -46,3 +63,116 @@ class TestChatEndpoints:
     async def test_get_citations_returns_list(self, client: AsyncClient):
         """GET /chat/messages/{id}/citations returns citation list."""
         pass
+
+
+class TestCitationPersistence:
+    """Test cases for saving and loading message citations."""
+
+    @pytest.mark.asyncio
+    async def test_save_and_load_round_trip(self, db):
+        """Linked citations are saved in order with the pending message."""
+        await crud.create_document(
+            db=db,
+            doc_id="doc-1",
+            filename="algebra.pdf",
+            title="Algebra",
+            storage_path="/tmp/doc-1",
+            grade="S1",
+            subject="mathematics",
+        )
+        await crud.create_chunks(
+            db,
+            [
+                {
+                    "id": f"chunk-{page}",
+                    "document_id": "doc-1",
+                    "content": "...",
+                    "page_start": page,
+                    "page_end": page,
+                    "chunk_index": i,
+                }
+                for i, page in enumerate((3, 7))
+            ],
+        )
+
+        extractor = CitationExtractor()
+        citations, chunks_map = extractor.extract_citations(
+            [
+                {
+                    "content": "Quadratics",
+                    "score": 0.9,
+                    "metadata": {
+                        "doc_id": "doc-1",
+                        "title": "Algebra",
+                        "page_start": 7,
+                        "chunk_id": "chunk-7",
+                    },
+                },
+                {
+                    "content": "Unlinked",
+                    "score": 0.8,
+                    "metadata": {"doc_id": "doc-1", "page_start": 5},
+                },
+                {
+                    "content": "Linear equations",
+                    "score": 0.7,
+                    "metadata": {
+                        "doc_id": "doc-1",
+                        "title": "Algebra",
+                        "page_start": 3,
+                        "chunk_id": "chunk-3",
+                    },
+                },
+            ]
+        )
+
+        db.add(
+            Message(
+                id="msg-1",
+                user_role="student",
+                question="What is a quadratic?",
+                answer="...",
+                grade="S1",
+                subject="mathematics",
+            )
+        )
+        await extractor.save_citations(db, "msg-1", citations, chunks_map)
+        await db.commit()
+
+        saved = await extractor.get_message_citations(db, "msg-1")
+        assert [(c.page_start, c.doc_title) for c in saved] == [
+            (7, "Algebra"),
+            (3, "Algebra"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_empty_snippet_falls_back_to_chunk_text(self, db):
+        """A citation saved without a snippet previews the chunk content."""
+        await crud.create_document(
+            db=db,
+            doc_id="doc-1",
+            filename="algebra.pdf",
+            title="Algebra",
+            storage_path="/tmp/doc-1",
+            grade="S1",
+            subject="mathematics",
+        )
+        await crud.create_chunks(
+            db,
+            [
+                {
+                    "id": "chunk-1",
+                    "document_id": "doc-1",
+                    "content": "x" * 500,
+                    "page_start": 1,
+                    "page_end": 1,
+                    "chunk_index": 0,
+                }
+            ],
+        )
+        db.add(MessageCitation(id="cit-1", message_id="msg-1", chunk_id="chunk-1"))
+        await db.commit()
+
+        [citation] = await CitationExtractor().get_message_citations(db, "msg-1")
+        assert citation.chunk_preview == "x" * 200
+        assert citation.relevance_score == 0.0
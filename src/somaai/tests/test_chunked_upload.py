@@ -0,0 +1,117 @@
+"""Tests for chunked upload helpers."""
+
+import hashlib
+from io import BytesIO
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from somaai.api.v1.endpoints.chunked_upload import (
+    SESSION_TTL,
+    _list_chunks,
+    _mark_chunk_received,
+    _reassemble_chunks,
+    _stream_to_file,
+)
+
+
+class TestReassembleChunks:
+    """Test cases for chunk reassembly."""
+
+    def test_concatenates_chunks_in_order(self, tmp_path):
+        """Chunks are joined byte-for-byte in the given order."""
+        parts = [b"a" * 300_000, b"b" * 10, b"", b"c" * 5]
+        chunks = []
+        for i, data in enumerate(parts):
+            chunk_path = tmp_path / f"chunk_{i:05d}"
+            chunk_path.write_bytes(data)
+            chunks.append(str(chunk_path))
+
+        final_path = tmp_path / "doc.pdf"
+        _reassemble_chunks(chunks, final_path)
+
+        assert final_path.read_bytes() == b"".join(parts)
+
+
+class TestListChunks:
+    """Test cases for chunk listing."""
+
+    def test_sorts_by_numeric_index(self, tmp_path):
+        """Chunks are ordered by index regardless of zero-padding."""
+        for name in ("chunk_10", "chunk_9", "chunk_00001", "doc.pdf"):
+            (tmp_path / name).write_bytes(b"")
+
+        names = [path.rsplit("/", 1)[-1] for path in _list_chunks(tmp_path)]
+        assert names == ["chunk_00001", "chunk_9", "chunk_10"]
+
+    def test_missing_directory_is_empty(self, tmp_path):
+        """A session directory that no longer exists has no chunks."""
+        assert _list_chunks(tmp_path / "gone") == []
+
+
+class TestStreamToFile:
+    """Test cases for streaming an upload to disk."""
+
+    @pytest.mark.asyncio
+    async def test_writes_content_and_returns_digest(self, tmp_path):
+        """The file matches the upload and size/digest describe it."""
+        data = b"x" * 200_000
+        path = tmp_path / "chunk_00000"
+
+        size, digest = await _stream_to_file(UploadFile(BytesIO(data)), path)
+
+        assert path.read_bytes() == data
+        assert size == len(data)
+        assert digest == hashlib.blake2b(data).hexdigest()
+
+
+class TestMarkChunkReceived:
+    """Test cases for recording received chunks in Redis."""
+
+    @pytest.mark.asyncio
+    async def test_refreshes_session_ttl(self, monkeypatch):
+        """Every chunk extends the session hash along with the chunk keys."""
+        redis = _FakeRedis()
+        monkeypatch.setattr(
+            "somaai.api.v1.endpoints.chunked_upload._get_redis", redis.get
+        )
+
+        assert await _mark_chunk_received("up-1", 0) == 1
+        assert ("expire", "somaai:upload:session:up-1", SESSION_TTL) in redis.calls
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_is_retryable(self, monkeypatch):
+        """A Redis error becomes a 503 telling the client to resend."""
+
+        async def unavailable():
+            raise ConnectionError("redis unavailable")
+
+        monkeypatch.setattr(
+            "somaai.api.v1.endpoints.chunked_upload._get_redis", unavailable
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await _mark_chunk_received("up-1", 0)
+        assert exc_info.value.status_code == 503
+
+
+class _FakeRedis:
+    """Records pipelined commands; SCARD reports one received chunk."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def get(self):
+        return self
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def __getattr__(self, name):
+        def command(*args, **kwargs):
+            self.calls.append((name, *args))
+
+        return command
+
+    async def execute(self):
+        return [1 if name == "scard" else True for name, *_ in self.calls]
@@ -0,0 +1,99 @@
+"""Tests for the contracts package."""
+
+import subprocess
+import sys
+from datetime import datetime
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+import somaai.contracts as contracts
+from somaai.contracts.common import UserRole
+from somaai.contracts.feedback import FeedbackRequest, FeedbackResponse
+from somaai.contracts.jobs import JobResponse
+from somaai.db.models import Feedback, Job
+from somaai.jobs.queue import _to_job_response
+from somaai.modules.feedback.service import FeedbackService
+
+
+class TestContractsPackage:
+    """Test cases for lazy contract exports."""
+
+    def test_all_exports_resolve(self):
+        """Every name in __all__ resolves to its defining submodule's object."""
+        for name in contracts.__all__:
+            assert getattr(contracts, name) is not None
+
+    def test_all_matches_export_map(self):
+        """__all__ has no duplicates and lists exactly the mapped exports."""
+        assert len(contracts.__all__) == len(set(contracts.__all__))
+        assert set(contracts.__all__) == set(contracts._EXPORTS)
+
+    def test_models_are_built_at_import(self):
+        """Every exported model has its validator built, none deferred."""
+        exported = [getattr(contracts, name) for name in contracts.__all__]
+        models = [
+            obj
+            for obj in exported
+            if isinstance(obj, type) and issubclass(obj, BaseModel)
+        ]
+        assert models
+        assert [m.__name__ for m in models if not m.__pydantic_complete__] == []
+
+    def test_submodule_import_is_lazy(self):
+        """Importing one submodule does not import the others."""
+        code = (
+            "import sys, somaai.contracts.chat; "
+            "print('somaai.contracts.quiz' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+
+class TestTrustedRowConversion:
+    """model_construct conversions must match full validation."""
+
+    def test_job_response_matches_validated(self):
+        """Job rows convert to the same JobResponse as model_validate."""
+        job = Job(
+            id="job-1",
+            task_name="ingest_document",
+            status="running",
+            progress_pct=40,
+            created_at=datetime(2025, 1, 1, 12, 0),
+            started_at=datetime(2025, 1, 1, 12, 1),
+        )
+        constructed = _to_job_response(job)
+        validated = JobResponse.model_validate(constructed.model_dump())
+        assert constructed == validated
+        assert constructed.model_dump_json() == validated.model_dump_json()
+
+    def test_feedback_response_matches_validated(self):
+        """Feedback rows convert to the same FeedbackResponse as model_validate."""
+        feedback = Feedback(
+            id="fb-1",
+            message_id="msg-1",
+            useful=True,
+            text="Clear answer",
+            tags=["clear"],
+            created_at=datetime(2025, 1, 1, 12, 0),
+        )
+        constructed = FeedbackService._to_response(feedback, UserRole.STUDENT)
+        validated = FeedbackResponse.model_validate(constructed.model_dump())
+        assert constructed == validated
+        assert constructed.model_dump_json() == validated.model_dump_json()
+
+
+class TestFeedbackRequestTags:
+    """Feedback tags are bounded in count and length."""
+
+    def test_rejects_oversized_tags(self):
+        """More than 16 tags, or a tag over 64 chars, fails validation."""
+        body = {"message_id": "msg-1", "useful": True, "user_role": "teacher"}
+        assert len(FeedbackRequest(**body, tags=["clear"] * 16).tags) == 16
+        with pytest.raises(ValidationError):
+            FeedbackRequest(**body, tags=["clear"] * 17)
+        with pytest.raises(ValidationError):
+            FeedbackRequest(**body, tags=["x" * 65])
@@ -0,0 +1,188 @@
+"""Tests for database CRUD helpers."""
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from somaai.db import crud
+from somaai.db.base import Base
+
+
+@pytest.fixture
+async def db():
+    """In-memory SQLite session with all tables created."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+async def _create(db, doc_id, content_hash, grade="S1", subject="mathematics"):
+    return await crud.create_document(
+        db=db,
+        doc_id=doc_id,
+        filename="algebra.pdf",
+        title="Algebra",
+        storage_path=f"/tmp/{doc_id}",
+        grade=grade,
+        subject=subject,
+        content_hash=content_hash,
+    )
+
+
+class TestDocumentContentHash:
+    """Test cases for content-hash deduplication."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_by_hash_within_grade_and_subject(self, db):
+        """Documents are found by hash only for the same grade and subject."""
+        await _create(db, "doc-1", "abc")
+
+        found = await crud.get_document_by_hash(db, "abc", "S1", "mathematics")
+        assert found is not None and found.id == "doc-1"
+        assert await crud.get_document_by_hash(db, "abc", "S2", "mathematics") is None
+
+    @pytest.mark.asyncio
+    async def test_server_defaults_loaded_without_refresh(self, db):
+        """uploaded_at is populated on the returned row after commit."""
+        doc = await _create(db, "doc-1", "abc")
+        assert doc.uploaded_at is not None
+
+    @pytest.mark.asyncio
+    async def test_duplicate_content_is_rejected(self, db):
+        """The unique index rejects a second copy in the same grade/subject."""
+        await _create(db, "doc-1", "abc")
+        await _create(db, "doc-2", "abc", grade="S2")
+
+        with pytest.raises(IntegrityError):
+            await _create(db, "doc-3", "abc")
+
+
+class TestDeferredCommit:
+    """Test cases for batching document and job rows in one transaction."""
+
+    @pytest.mark.asyncio
+    async def test_document_and_job_commit_together(self, db):
+        """Rows added with commit=False persist on a single commit."""
+        await crud.create_document(
+            db=db,
+            doc_id="doc-1",
+            filename="algebra.pdf",
+            title="Algebra",
+            storage_path="/tmp/doc-1",
+            grade="S1",
+            subject="mathematics",
+            commit=False,
+        )
+        await crud.create_job(db, "job-1", "ingest_document", {}, commit=False)
+        await db.commit()
+
+        assert await crud.get_document(db, "doc-1") is not None
+        assert await crud.get_job(db, "job-1") is not None
+
+    @pytest.mark.asyncio
+    async def test_processed_document_and_completed_job_roll_back_together(self, db):
+        """Deferred updates are discarded together if never committed."""
+        await _create(db, "doc-1", "a" * 64)
+        await crud.create_job(db, "job-1", "ingest_document", {})
+
+        await crud.update_document_processed(db, "doc-1", 12, commit=False)
+        await crud.update_job_status(db, "job-1", "completed", commit=False)
+        await db.rollback()
+
+        assert (await crud.get_document(db, "doc-1")).processed_at is None
+        assert (await crud.get_job(db, "job-1")).status == "pending"
+
+
+class TestCreateChunks:
+    """Test cases for bulk chunk insertion."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_returns_ids_in_order(self, db):
+        """All chunks are stored and their IDs come back in input order."""
+        await _create(db, "doc-1", "abc")
+        chunks = [
+            {
+                "id": f"chunk-{i}",
+                "document_id": "doc-1",
+                "content": f"Section {i}",
+                "page_start": 1,
+                "page_end": 2,
+                "chunk_index": i,
+            }
+            for i in range(3)
+        ]
+        chunks[0]["embedding_id"] = "emb-0"
+
+        assert await crud.create_chunks(db, chunks) == ["chunk-0", "chunk-1", "chunk-2"]
+        stored = await crud.get_chunk(db, "chunk-0")
+        assert stored.content == "Section 0" and stored.embedding_id == "emb-0"
+        assert (await crud.get_chunk(db, "chunk-2")).embedding_id is None
+
+    @pytest.mark.asyncio
+    async def test_document_with_chunks_loads_in_order(self, db):
+        """Chunks are eagerly loaded and ordered by chunk_index."""
+        await _create(db, "doc-1", "abc")
+        await crud.create_chunks(
+            db,
+            [
+                {
+                    "id": f"chunk-{i}",
+                    "document_id": "doc-1",
+                    "content": f"Section {i}",
+                    "page_start": 1,
+                    "page_end": 1,
+                    "chunk_index": i,
+                }
+                for i in (2, 0, 1)
+            ],
+        )
+        db.expunge_all()
+
+        doc = await crud.get_document_with_chunks(db, "doc-1")
+        assert [c.id for c in doc.chunks] == ["chunk-0", "chunk-1", "chunk-2"]
+        assert await crud.get_document_with_chunks(db, "missing") is None
+
+
+class TestUpdateJob:
+    """Test cases for single-statement job updates."""
+
+    @pytest.mark.asyncio
+    async def test_status_transitions_set_timestamps(self, db):
+        """Running sets started_at once; completed sets completed_at."""
+        await crud.create_job(db, "job-1", "ingest_document", {})
+
+        running = await crud.update_job_status(db, "job-1", "running")
+        started_at = running.started_at
+        assert started_at is not None and running.completed_at is None
+
+        rerun = await crud.update_job_status(db, "job-1", "running", progress_pct=5)
+        assert rerun.started_at == started_at
+
+        done = await crud.update_job_status(
+            db, "job-1", "completed", progress_pct=100, result_id="doc-1"
+        )
+        assert done.status == "completed" and done.result_id == "doc-1"
+        assert done.completed_at is not None
+
+    @pytest.mark.asyncio
+    async def test_progress_and_missing_job(self, db):
+        """Progress updates persist; unknown jobs return None."""
+        await crud.create_job(db, "job-1", "ingest_document", {})
+        assert (await crud.update_job_progress(db, "job-1", 40)).progress_pct == 40
+        assert (await crud.get_job(db, "job-1")).progress_pct == 40
+
+        assert await crud.update_job_progress(db, "missing", 10) is None
+        assert await crud.update_job_status(db, "missing", "failed") is None
+
+    @pytest.mark.asyncio
+    async def test_get_jobs_fetches_many_at_once(self, db):
+        """Bulk lookup returns existing jobs and ignores unknown IDs."""
+        for job_id in ("job-1", "job-2", "job-3"):
+            await crud.create_job(db, job_id, "ingest_document", {})
+
+        jobs = await crud.get_jobs(db, ["job-3", "missing", "job-1"])
+        assert sorted(job.id for job in jobs) == ["job-1", "job-3"]
+        assert await crud.get_jobs(db, []) == []
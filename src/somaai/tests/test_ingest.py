@@ -0,0 +1,214 @@
+"""Tests for ingest endpoints."""
+
+import json
+from datetime import datetime
+from io import BytesIO
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from somaai.api.v1.endpoints.ingest import _read_limited, _resume_existing
+from somaai.contracts.common import JobStatus
+from somaai.contracts.jobs import JobResponse
+from somaai.db import crud
+from somaai.db.base import Base
+
+
+@pytest.fixture
+async def db():
+    """In-memory SQLite session with all tables created."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+class TestReadLimited:
+    """Test cases for streaming uploads with a size limit."""
+
+    @pytest.mark.asyncio
+    async def test_yields_chunks_within_limit(self, monkeypatch):
+        """Uploads under the limit are yielded in read-size chunks."""
+        monkeypatch.setattr("somaai.api.v1.endpoints.ingest.UPLOAD_READ_SIZE", 4)
+        upload = UploadFile(BytesIO(b"abcdefghij"))
+        chunks = [chunk async for chunk in _read_limited(upload)]
+        assert chunks == [b"abcd", b"efgh", b"ij"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_once_over_limit(self, monkeypatch):
+        """The stream fails as soon as the running total passes the limit."""
+        monkeypatch.setattr("somaai.api.v1.endpoints.ingest.UPLOAD_READ_SIZE", 4)
+        monkeypatch.setattr("somaai.api.v1.endpoints.ingest.MAX_FILE_SIZE", 6)
+        upload = UploadFile(BytesIO(b"abcdefghij"))
+        received = []
+        with pytest.raises(HTTPException) as exc_info:
+            async for chunk in _read_limited(upload):
+                received.append(chunk)
+        assert exc_info.value.status_code == 400
+        assert received == [b"abcd"]
+
+
+class TestDuplicateUpload:
+    """Test cases for re-uploading content that is already stored."""
+
+    @pytest.fixture
+    async def document(self, db, monkeypatch):
+        """Stored, unprocessed document with enqueue_job recorded."""
+        self.enqueued = []
+
+        async def fake_enqueue(task_name, payload, db=None):
+            self.enqueued.append(payload)
+            return "job-new"
+
+        monkeypatch.setattr(
+            "somaai.api.v1.endpoints.ingest.enqueue_job", fake_enqueue
+        )
+        return await crud.create_document(
+            db=db,
+            doc_id="doc-1",
+            filename="algebra.pdf",
+            title="Algebra",
+            storage_path="/tmp/doc-1",
+            grade="S1",
+            subject="mathematics",
+            content_hash="a" * 64,
+        )
+
+    @pytest.mark.asyncio
+    async def test_processed_document_is_not_reingested(self, db, document):
+        """Only processed documents short-circuit as completed."""
+        await crud.update_document_processed(db, "doc-1", 3)
+
+        response = await _resume_existing(db, document)
+
+        assert (response.job_id, response.status) == (None, "completed")
+        assert self.enqueued == []
+
+    @pytest.mark.asyncio
+    async def test_in_flight_job_is_returned(self, db, document):
+        """A pending or running first ingest reports its own job."""
+        await crud.create_job(db, "job-1", "ingest_document", {"doc_id": "doc-1"})
+        await crud.update_job_status(db, "job-1", "running")
+
+        response = await _resume_existing(db, document)
+
+        assert (response.job_id, response.status) == ("job-1", "running")
+        assert self.enqueued == []
+
+    @pytest.mark.asyncio
+    async def test_failed_ingest_is_restarted(self, db, document):
+        """A failed first ingest is retried against the existing document."""
+        await crud.create_job(db, "job-1", "ingest_document", {"doc_id": "doc-1"})
+        await crud.update_job_status(db, "job-1", "failed", error="boom")
+
+        response = await _resume_existing(db, document)
+
+        assert (response.job_id, response.status) == ("job-new", "pending")
+        assert self.enqueued[0]["doc_id"] == "doc-1"
+        assert self.enqueued[0]["file_path"] == "/tmp/doc-1"
+
+
+class TestIngestJobStatus:
+    """Test cases for /api/v1/ingest/jobs/{job_id}."""
+
+    def test_returns_job_json(self, client, monkeypatch):
+        """The pre-serialized body matches the JobResponse schema output."""
+        job = JobResponse(
+            job_id="job-1",
+            status=JobStatus.RUNNING,
+            progress_pct=40,
+            created_at=datetime(2024, 1, 1),
+        )
+
+        async def fake_status(job_id):
+            return job
+
+        monkeypatch.setattr(
+            "somaai.api.v1.endpoints.ingest.get_job_status", fake_status
+        )
+
+        response = client.get("/api/v1/ingest/jobs/job-1")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == job.model_dump(mode="json")
+
+
+class TestIngestJobEvents:
+    """Test cases for /api/v1/ingest/jobs/{job_id}/events."""
+
+    def test_streams_changes_until_completed(self, client, monkeypatch):
+        """Each status change is one event; the stream ends on completion."""
+        states = iter(
+            [
+                (JobStatus.RUNNING, 10),
+                (JobStatus.RUNNING, 10),
+                (JobStatus.RUNNING, 60),
+                (JobStatus.COMPLETED, 100),
+            ]
+        )
+
+        async def fake_status(job_id):
+            status, progress = next(states)
+            return JobResponse(
+                job_id=job_id,
+                status=status,
+                progress_pct=progress,
+                created_at=datetime(2024, 1, 1),
+            )
+
+        monkeypatch.setattr(
+            "somaai.api.v1.endpoints.ingest.get_job_status", fake_status
+        )
+        monkeypatch.setattr("somaai.api.v1.endpoints.ingest.JOB_EVENTS_INTERVAL", 0)
+
+        response = client.get("/api/v1/ingest/jobs/job-1/events")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            json.loads(line[len("data: "):])
+            for line in response.text.splitlines()
+            if line.startswith("data: ")
+        ]
+        assert [(e["status"], e["progress_pct"]) for e in events] == [
+            ("running", 10),
+            ("running", 60),
+            ("completed", 100),
+        ]
+
+    def test_stuck_job_times_out_with_keepalives(self, client, monkeypatch):
+        """A job that never finishes gets keepalives, then a final timeout event."""
+
+        async def stuck(job_id):
+            return JobResponse(
+                job_id=job_id,
+                status=JobStatus.RUNNING,
+                progress_pct=30,
+                created_at=datetime(2024, 1, 1),
+            )
+
+        monkeypatch.setattr("somaai.api.v1.endpoints.ingest.get_job_status", stuck)
+        monkeypatch.setattr("somaai.api.v1.endpoints.ingest.JOB_EVENTS_INTERVAL", 0.01)
+        monkeypatch.setattr("somaai.api.v1.endpoints.ingest.JOB_EVENTS_KEEPALIVE", 0)
+        monkeypatch.setattr(
+            "somaai.api.v1.endpoints.ingest.JOB_EVENTS_MAX_DURATION", 0.05
+        )
+
+        body = client.get("/api/v1/ingest/jobs/job-1/events").text
+
+        assert body.startswith("event: status\n")
+        assert ": keepalive\n\n" in body
+        assert body.rstrip("\n").splitlines()[-2] == "event: timeout"
+
+    def test_unknown_job_returns_404(self, client, monkeypatch):
+        """Missing jobs are rejected before the stream starts."""
+
+        async def no_job(job_id):
+            return None
+
+        monkeypatch.setattr("somaai.api.v1.endpoints.ingest.get_job_status", no_job)
+
+        assert client.get("/api/v1/ingest/jobs/missing/events").status_code == 404
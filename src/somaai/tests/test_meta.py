@@ -3,29 +3,48 @@
 import pytest
 from httpx import AsyncClient
 
+from somaai.contracts.common import GradeLevel, Subject
+
 
 class TestMetaEndpoints:
     """Test cases for /api/v1/meta endpoints."""
 
-    @pytest.mark.asyncio
-    async def test_get_grades_returns_list(self, client: AsyncClient):
+    def test_get_grades_returns_list(self, client):
         """GET /meta/grades should return a list of grades."""
-        pass
+        response = client.get("/api/v1/meta/grades")
+        assert response.status_code == 200
+        assert [g["id"] for g in response.json()] == [g.value for g in GradeLevel]
 
-    @pytest.mark.asyncio
-    async def test_get_grades_contains_expected_fields(self, client: AsyncClient):
+    def test_get_grades_contains_expected_fields(self, client):
         """Each grade should have id, name, display_order."""
-        pass
-
-    @pytest.mark.asyncio
-    async def test_get_subjects_without_grade(self, client: AsyncClient):
+        grade = client.get("/api/v1/meta/grades").json()[0]
+        assert grade == {
+            "id": "P6",
+            "name": "Primary 6",
+            "display_order": 1,
+            "level": "primary",
+        }
+
+    def test_get_subjects_without_grade(self, client):
         """GET /meta/subjects without grade returns all subjects."""
-        pass
+        response = client.get("/api/v1/meta/subjects")
+        assert response.status_code == 200
+        assert [s["id"] for s in response.json()] == [s.value for s in Subject]
 
-    @pytest.mark.asyncio
-    async def test_get_subjects_with_grade_filter(self, client: AsyncClient):
+    def test_get_subjects_with_grade_filter(self, client):
         """GET /meta/subjects?grade=P1 returns filtered subjects."""
-        pass
+        response = client.get("/api/v1/meta/subjects", params={"grade": "S1"})
+        assert response.status_code == 200
+        assert len(response.json()) == len(Subject)
+
+    def test_get_grades_not_modified(self, client):
+        """A matching If-None-Match gets 304 without a body."""
+        etag = client.get("/api/v1/meta/grades").headers["etag"]
+        response = client.get(
+            "/api/v1/meta/grades", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
 
     @pytest.mark.asyncio
     async def test_get_topics_requires_grade_and_subject(self, client: AsyncClient):
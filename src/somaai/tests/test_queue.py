@@ -0,0 +1,135 @@
+"""Tests for the job queue."""
+
+import asyncio
+import pickle
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from somaai.contracts.jobs import JobStatus
+from somaai.db.base import Base
+from somaai.jobs import queue
+from somaai.jobs.decorators import with_progress_callback
+from somaai.jobs.tasks import TASK_REGISTRY
+
+
+@pytest.fixture
+async def session_maker(monkeypatch):
+    """Point the queue at an in-memory SQLite database."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    maker = async_sessionmaker(engine, expire_on_commit=False)
+    monkeypatch.setattr(queue, "async_session_maker", maker)
+    monkeypatch.setattr("somaai.settings.settings.queue_backend", "sync")
+    yield maker
+    await engine.dispose()
+
+
+class TestSyncDispatch:
+    """Test cases for running jobs inline in sync mode."""
+
+    @pytest.mark.asyncio
+    async def test_task_owns_status_transitions(self, session_maker, monkeypatch):
+        """The task's completion, including result_id, is not overwritten."""
+        calls = []
+
+        async def fake_task(job_id, doc_id):
+            calls.append(doc_id)
+            await queue.update_job_status(job_id, JobStatus.RUNNING)
+            await queue.update_job_status(
+                job_id, JobStatus.COMPLETED, progress_pct=100, result_id=doc_id
+            )
+
+        monkeypatch.setitem(TASK_REGISTRY, "fake", fake_task)
+
+        job_id = await queue.enqueue_job("fake", {"doc_id": "doc-1"})
+
+        job = await queue.get_job_status(job_id)
+        assert calls == ["doc-1"]
+        assert job.status == JobStatus.COMPLETED
+        assert job.result_id == "doc-1"
+
+
+class TestJobSerialization:
+    """Test cases for the ARQ job serializer."""
+
+    def test_payloads_round_trip_as_json(self):
+        """Plain job records are written as JSON."""
+        record = {"f": "ingest_document", "k": {"job_id": "j1", "doc_id": "d1"}}
+
+        data = queue.job_dumps(record)
+
+        assert data[:1] in (b"{", "{")
+        assert queue.job_loads(data) == record
+
+    def test_failed_result_falls_back_to_pickle(self):
+        """An exception result is still stored and read back."""
+        data = queue.job_dumps({"s": False, "r": ValueError("boom")})
+
+        result = queue.job_loads(data)["r"]
+        assert isinstance(result, ValueError)
+        assert str(result) == "boom"
+
+    def test_reads_jobs_pickled_before_the_switch(self):
+        """Jobs queued with ARQ's pickle default are still readable."""
+        record = {"f": "generate_quiz", "k": {"job_id": "j2"}}
+
+        assert queue.job_loads(pickle.dumps(record)) == record
+
+
+class TestProgressBuffer:
+    """Test cases for batched progress writes."""
+
+    @pytest.mark.asyncio
+    async def test_ticks_coalesce_into_latest_value(self, session_maker):
+        """Only the last tick per job is written, in one flush."""
+        job_id = await queue.enqueue_job("unregistered", {})
+        buffer = queue.ProgressBuffer(flush_interval=60)
+
+        for pct in (10, 20, 35):
+            buffer.update(job_id, pct)
+        await buffer.flush()
+
+        assert (await queue.get_job_status(job_id)).progress_pct == 35
+        buffer._flush_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_finished_jobs_keep_final_progress(self, session_maker):
+        """A late tick cannot move a completed job backwards."""
+        job_id = await queue.enqueue_job("unregistered", {})
+        await queue.update_job_status(job_id, JobStatus.COMPLETED, progress_pct=100)
+
+        buffer = queue.ProgressBuffer(flush_interval=60)
+        buffer.update(job_id, 80)
+        await buffer.flush()
+
+        assert (await queue.get_job_status(job_id)).progress_pct == 100
+        buffer._flush_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_ticks_are_skipped(self, session_maker):
+        """A tick equal to the last written value schedules no write."""
+        job_id = await queue.enqueue_job("unregistered", {})
+        buffer = queue.ProgressBuffer(flush_interval=60)
+        buffer.update(job_id, 50)
+        await buffer.flush()
+
+        buffer.update(job_id, 50)
+        assert buffer._pending == {}
+        buffer.update(job_id, 60)
+        assert buffer._pending == {job_id: 60}
+        buffer._flush_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_callback_from_worker_thread_is_recorded(self, session_maker):
+        """Ticks reported off the event loop thread still reach the DB."""
+        job_id = await queue.enqueue_job("unregistered", {})
+
+        @with_progress_callback()
+        async def task(job_id, progress_callback):
+            await asyncio.to_thread(progress_callback, 70, "parsing")
+
+        await task(job_id=job_id)
+
+        assert (await queue.get_job_status(job_id)).progress_pct == 70
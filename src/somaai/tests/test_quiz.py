@@ -12,15 +12,26 @@ class TestQuizEndpoints:
         """POST /quiz/generate returns quiz_id, job_id, status."""
         pass
 
-    @pytest.mark.asyncio
-    async def test_generate_quiz_requires_topic_ids(self, client: AsyncClient):
+    def test_generate_quiz_requires_topic_ids(self, client):
         """POST /quiz/generate without topic_ids returns 422."""
-        pass
+        response = client.post("/api/v1/quiz/generate", json={})
+        assert response.status_code == 422
+        locs = [error["loc"] for error in response.json()["detail"]]
+        assert ["body", "topic_ids"] in locs
 
-    @pytest.mark.asyncio
-    async def test_generate_quiz_validates_num_questions(self, client: AsyncClient):
+    def test_generate_quiz_validates_num_questions(self, client):
         """POST /quiz/generate with invalid num_questions returns 422."""
-        pass
+        response = client.post("/api/v1/quiz/generate", json={"num_questions": 999})
+        assert response.status_code == 422
+        errors = response.json()["detail"]
+        assert any(error["loc"] == ["body", "num_questions"] for error in errors)
+
+    def test_generate_quiz_body_schema_documented(self, client):
+        """The request schema is still published in OpenAPI."""
+        spec = client.get("/openapi.json").json()
+        body = spec["paths"]["/api/v1/quiz/generate"]["post"]["requestBody"]
+        schema = body["content"]["application/json"]["schema"]
+        assert "topic_ids" in schema["properties"]
 
     @pytest.mark.asyncio
     async def test_get_quiz_pending_status(self, client: AsyncClient):
@@ -0,0 +1,268 @@
+"""Tests for API security helpers."""
+
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+
+from somaai.api.security import (
+    APIKeyAuth,
+    RateLimiter,
+    RedisRateLimiter,
+    get_api_key_auth,
+    get_client_id,
+    hash_api_key,
+    rate_limit,
+    verify_api_key,
+)
+from somaai.middleware import RateLimitMiddleware
+
+
+class TestRateLimiter:
+    """Test cases for the in-memory RateLimiter."""
+
+    def test_allows_up_to_limit(self):
+        """Requests within the limit are allowed with decreasing remaining."""
+        limiter = RateLimiter()
+        results = [limiter.is_allowed("ip:1", limit=3) for _ in range(3)]
+        assert [allowed for allowed, _ in results] == [True, True, True]
+        assert results[-1][1] == 0
+
+    def test_blocks_over_limit(self):
+        """Requests beyond the limit are rejected."""
+        limiter = RateLimiter()
+        for _ in range(3):
+            limiter.is_allowed("ip:1", limit=3)
+        assert limiter.is_allowed("ip:1", limit=3) == (False, 0)
+
+    def test_clients_are_independent(self):
+        """Each client has its own budget."""
+        limiter = RateLimiter()
+        for _ in range(3):
+            limiter.is_allowed("ip:1", limit=3)
+        assert limiter.is_allowed("ip:2", limit=3)[0] is True
+
+    def test_reset_restores_budget(self):
+        """Reset clears a client's state."""
+        limiter = RateLimiter()
+        for _ in range(3):
+            limiter.is_allowed("ip:1", limit=3)
+        limiter.reset("ip:1")
+        assert limiter.is_allowed("ip:1", limit=3)[0] is True
+
+    def test_previous_window_is_weighted(self, monkeypatch):
+        """Requests from the previous window count proportionally."""
+        limiter = RateLimiter()
+        monkeypatch.setattr("somaai.api.security.time.time", lambda: 59.0)
+        for _ in range(4):
+            limiter.is_allowed("ip:1", limit=4, window_seconds=60)
+
+        # Halfway through the next window, half of the previous 4 still count
+        monkeypatch.setattr("somaai.api.security.time.time", lambda: 90.0)
+        assert limiter.is_allowed("ip:1", limit=4, window_seconds=60) == (True, 1)
+        assert limiter.is_allowed("ip:1", limit=4, window_seconds=60) == (True, 0)
+        assert limiter.is_allowed("ip:1", limit=4, window_seconds=60) == (False, 0)
+
+    def test_lru_bound_evicts_least_recently_used(self):
+        """Tracked clients never exceed max_clients; the LRU entry goes first."""
+        limiter = RateLimiter(max_clients=2, shards=1)
+        limiter.is_allowed("ip:1", limit=2)
+        limiter.is_allowed("ip:2", limit=2)
+        # Touch ip:1 so ip:2 becomes least recently used
+        limiter.is_allowed("ip:1", limit=2)
+        limiter.is_allowed("ip:3", limit=2)
+        assert len(limiter) == 2
+
+        # ip:1 kept its count; ip:2 was evicted and starts fresh
+        assert limiter.is_allowed("ip:1", limit=2) == (False, 0)
+        assert limiter.is_allowed("ip:2", limit=2) == (True, 1)
+
+    def test_sharded_bound_holds(self):
+        """The bound holds across shards for many distinct clients."""
+        limiter = RateLimiter(max_clients=32, shards=16)
+        for i in range(1000):
+            limiter.is_allowed(f"ip:{i}", limit=5)
+            assert len(limiter) <= 32
+
+    def test_denied_unknown_client_stores_nothing(self):
+        """Rejected probes from new clients do not allocate state."""
+        limiter = RateLimiter()
+        assert limiter.is_allowed("ip:probe", limit=0) == (False, 0)
+        assert len(limiter) == 0
+
+    def test_expire_drops_only_elapsed_entries(self, monkeypatch):
+        """expire removes entries past expires_at and keeps live ones."""
+        limiter = RateLimiter()
+        monkeypatch.setattr("somaai.api.security.time.time", lambda: 10.0)
+        limiter.is_allowed("ip:old", limit=5, window_seconds=60)
+
+        # ip:old (window 0) expires at 120s; ip:new (window 1) at 180s
+        monkeypatch.setattr("somaai.api.security.time.time", lambda: 70.0)
+        limiter.is_allowed("ip:new", limit=5, window_seconds=60)
+        assert limiter.expire() == 0
+
+        monkeypatch.setattr("somaai.api.security.time.time", lambda: 120.0)
+        assert limiter.expire() == 1
+        assert len(limiter) == 1
+        # ip:new still has its admitted request counted
+        assert limiter.is_allowed("ip:new", limit=5, window_seconds=60) == (True, 3)
+
+        monkeypatch.setattr("somaai.api.security.time.time", lambda: 240.0)
+        assert limiter.expire() == 1
+        assert len(limiter) == 0
+
+
+class TestRedisRateLimiter:
+    """Test cases for the Redis-backed RedisRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_memory_without_redis(self):
+        """Limiter keeps working in-process when Redis is unavailable."""
+        limiter = RedisRateLimiter(fallback=RateLimiter())
+        limiter._get_script = _unavailable
+        assert await limiter.is_allowed("ip:1", limit=1) == (True, 0)
+        assert await limiter.is_allowed("ip:1", limit=1) == (False, 0)
+
+    @pytest.mark.asyncio
+    async def test_lua_script_call_and_result(self, monkeypatch):
+        """Script gets the namespaced key and args; {allowed, remaining} maps back."""
+        monkeypatch.setattr("somaai.api.security.time.time", lambda: 12.5)
+        script = _FakeScript([[1, 4], [0, 0]])
+        limiter = RedisRateLimiter(fallback=RateLimiter())
+        limiter._script = script
+
+        assert await limiter.is_allowed("ip:1", limit=5, window_seconds=60) == (
+            True,
+            4,
+        )
+        assert await limiter.is_allowed("ip:1", limit=5, window_seconds=60) == (
+            False,
+            0,
+        )
+
+        keys, args = script.calls[0]
+        assert keys == ["somaai:ratelimit:ip:1"]
+        assert args[:3] == [12500, 60, 5]
+        assert args[3].startswith("12500-")
+        assert script.calls[0][1][3] != script.calls[1][1][3]
+
+    @pytest.mark.asyncio
+    async def test_skips_redis_during_cooldown(self, monkeypatch):
+        """After a failure Redis is not retried until the cooldown passes."""
+        clock = [100.0]
+        monkeypatch.setattr("somaai.api.security.time.monotonic", lambda: clock[0])
+        attempts = []
+
+        async def failing_script():
+            attempts.append(clock[0])
+            raise ConnectionError("redis unavailable")
+
+        limiter = RedisRateLimiter(fallback=RateLimiter())
+        limiter._get_script = failing_script
+
+        await limiter.is_allowed("ip:1", limit=5)
+        clock[0] += RedisRateLimiter.RETRY_AFTER_FAILURE - 1
+        await limiter.is_allowed("ip:1", limit=5)
+        assert len(attempts) == 1
+
+        clock[0] += 1
+        await limiter.is_allowed("ip:1", limit=5)
+        assert len(attempts) == 2
+
+
+class TestRateLimitDecorator:
+    """Test cases for the rate_limit decorator."""
+
+    @pytest.mark.asyncio
+    async def test_rejects_over_limit_with_headers(self):
+        """Over-limit requests get a 429 with rate limit headers."""
+        endpoint = rate_limit(limit=1, key_func=lambda _: "decorator:1")(_endpoint)
+        request = Request({"type": "http", "headers": [], "state": {}})
+
+        assert await endpoint(request) == "ok"
+        with pytest.raises(HTTPException) as exc_info:
+            await endpoint(request)
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.headers["X-RateLimit-Limit"] == "1"
+
+    def test_disabled_returns_endpoint_unwrapped(self, monkeypatch):
+        """With rate limiting disabled the endpoint is returned as-is."""
+        monkeypatch.setattr("somaai.settings.settings.rate_limit_disabled", True)
+        assert rate_limit(limit=1)(_endpoint) is _endpoint
+
+
+class TestRateLimitMiddleware:
+    """Test cases for the app-wide RateLimitMiddleware."""
+
+    def test_rejects_over_limit_with_headers(self):
+        """Requests past the default limit get a 429 before reaching routes."""
+        app = FastAPI()
+        app.add_middleware(RateLimitMiddleware, limit=1)
+        app.get("/ping")(lambda: {"ok": True})
+        headers = {"X-Forwarded-For": "203.0.113.7"}
+
+        with TestClient(app) as client:
+            assert client.get("/ping", headers=headers).status_code == 200
+            response = client.get("/ping", headers=headers)
+        assert response.status_code == 429
+        assert response.headers["X-RateLimit-Limit"] == "1"
+
+
+class TestApiKeyHash:
+    """Test cases for per-request API key hashing."""
+
+    def test_hash_is_cached_on_request_state(self):
+        """get_client_id and key validation share one hash per request."""
+        request = Request(
+            {"type": "http", "headers": [(b"x-api-key", b"secret")], "state": {}}
+        )
+        client_id = get_client_id(request)
+        assert request.state.api_key_hash == hash_api_key("secret")
+        assert client_id == f"key:{hash_api_key('secret').hex()[:16]}"
+
+        auth = APIKeyAuth()
+        auth.add_key("secret")
+        assert auth.validate_key_hash(request.state.api_key_hash) is not None
+
+
+class TestVerifyApiKey:
+    """Test cases for the API key dependencies."""
+
+    @pytest.mark.asyncio
+    async def test_missing_key_rejected_when_required(self, monkeypatch):
+        """Required auth rejects requests without a key."""
+        monkeypatch.setattr("somaai.api.security._REQUIRE_API_KEY", True)
+        with pytest.raises(HTTPException) as exc_info:
+            await verify_api_key(_request(), api_key=None)
+        assert exc_info.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_valid_key_returns_metadata(self, monkeypatch):
+        """A registered key returns its metadata."""
+        monkeypatch.setattr("somaai.api.security._REQUIRE_API_KEY", True)
+        get_api_key_auth().add_key("verify-secret", {"user": "teacher-1"})
+        metadata = await verify_api_key(_request(), api_key="verify-secret")
+        assert metadata == {"user": "teacher-1"}
+
+
+def _request():
+    return Request({"type": "http", "headers": [], "state": {}})
+
+
+async def _endpoint(request):
+    return "ok"
+
+
+async def _unavailable():
+    raise ConnectionError("redis unavailable")
+
+
+class _FakeScript:
+    """Stand-in for a registered Lua script that records its calls."""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.calls = []
+
+    async def __call__(self, keys, args):
+        self.calls.append((keys, args))
+        return self.results.pop(0)
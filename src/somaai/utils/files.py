@@ -13,6 +13,7 @@ import hashlib
 import os
 import shutil
 import tempfile
+from collections.abc import AsyncIterable
 from pathlib import Path
 from typing import BinaryIO
 
@@ -267,6 +268,45 @@ async def async_safe_write(
     return p
 
 
+async def async_safe_write_stream(
+    path: str | Path,
+    chunks: AsyncIterable[bytes],
+) -> Path:
+    """Async atomic write from a stream of chunks.
+
+    Like async_safe_write, but writes each chunk as it arrives so the
+    full content is never held in memory. If the stream raises, the
+    temp file is removed and nothing is written at path.
+
+    Args:
+        path: Final destination path
+        chunks: Async iterable of content chunks
+
+    Returns:
+        Path where file was written
+    """
+    p = Path(path)
+    await async_ensure_dir(p.parent)
+
+    fd, temp_path = tempfile.mkstemp(dir=str(p.parent))
+    os.close(fd)
+    try:
+        async with aiofiles.open(temp_path, "wb") as f:
+            async for chunk in chunks:
+                await f.write(chunk)
+        # Atomic move
+        shutil.move(temp_path, str(p))
+    except BaseException:
+        # Cleanup temp file on error (including cancellation)
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+    return p
+
+
 async def async_delete_file(path: str | Path) -> bool:
     """Async delete a file.
 
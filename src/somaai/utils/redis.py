@@ -6,7 +6,9 @@ Provides singleton Redis clients for different databases with proper configurati
 from __future__ import annotations
 
 import logging
+import os
 from typing import TYPE_CHECKING
+from urllib.parse import unquote, urlsplit
 
 if TYPE_CHECKING:
     import redis.asyncio as aioredis
@@ -17,45 +19,49 @@ logger = logging.getLogger(__name__)
 _REDIS_GENERAL: "aioredis.Redis | None" = None
 _REDIS_JOBS: "aioredis.Redis | None" = None
 _REDIS_CACHE: "aioredis.Redis | None" = None
+_REDIS_RATELIMIT: "aioredis.Redis | None" = None
+# Dedicated rate limit pool: size, and seconds to wait for a free connection
+RATELIMIT_MAX_CONNECTIONS = 64
+RATELIMIT_POOL_TIMEOUT = 0.5
 
+# Process that created the singletons; a forked worker must not reuse them
+_OWNER_PID: int | None = None
 
-def parse_redis_url(url: str) -> tuple[str, int, int, str | None]:
+
+def _drop_inherited_clients() -> None:
+    """Forget singletons inherited across a fork.
+
+    The parent's pooled sockets are not closed here since the parent still
+    owns them; the child simply creates its own clients on first use.
+    """
+    global _REDIS_GENERAL, _REDIS_JOBS, _REDIS_CACHE, _REDIS_RATELIMIT, _OWNER_PID
+    pid = os.getpid()
+    if _OWNER_PID != pid:
+        _REDIS_GENERAL = None
+        _REDIS_JOBS = None
+        _REDIS_CACHE = None
+        _REDIS_RATELIMIT = None
+        _OWNER_PID = pid
+
+
+def parse_redis_url(url: str, default_db: int = 0) -> tuple[str, int, int, str | None]:
     """Parse Redis URL into components.
 
     Args:
         url: Redis URL (redis://host:port/db or redis://:password@host:port/db)
+        default_db: Database number when the URL has no path
 
     Returns:
         Tuple of (host, port, db, password)
     """
-    # Handle password in URL
-    password = None
-    if "@" in url:
-        # Format: redis://:password@host:port/db
-        auth_part, rest = url.split("@", 1)
-        if ":" in auth_part:
-            password = auth_part.split(":")[-1]
-        url_part = rest
-    else:
-        # Format: redis://host:port/db
-        url_part = url.split("://", 1)[1] if "://" in url else url
-
-    # Parse host:port/db
-    if "/" in url_part:
-        host_port, db_str = url_part.rsplit("/", 1)
-        db = int(db_str)
-    else:
-        host_port = url_part
-        db = 0
-
-    if ":" in host_port:
-        host, port_str = host_port.rsplit(":", 1)
-        port = int(port_str)
-    else:
-        host = host_port
-        port = 6379
-
-    return host, port, db, password
+    parts = urlsplit(url if "://" in url else f"redis://{url}")
+    db_str = parts.path.lstrip("/")
+    return (
+        parts.hostname or "localhost",
+        parts.port or 6379,
+        int(db_str) if db_str else default_db,
+        unquote(parts.password) if parts.password else None,
+    )
 
 
 async def get_redis_client(
@@ -99,6 +105,7 @@ async def get_general_redis() -> "aioredis.Redis":
         Redis client
     """
     global _REDIS_GENERAL
+    _drop_inherited_clients()
     if _REDIS_GENERAL is None:
         from somaai.settings import settings
         logger.info(f"Creating general Redis client: {settings.redis_url}")
@@ -113,6 +120,7 @@ async def get_jobs_redis() -> "aioredis.Redis":
         Redis client for jobs
     """
     global _REDIS_JOBS
+    _drop_inherited_clients()
     if _REDIS_JOBS is None:
         from somaai.settings import settings
         url = getattr(settings, "redis_jobs_url", settings.redis_url.replace("/0", "/1"))
@@ -128,6 +136,7 @@ async def get_cache_redis() -> "aioredis.Redis":
         Redis client for cache
     """
     global _REDIS_CACHE
+    _drop_inherited_clients()
     if _REDIS_CACHE is None:
         from somaai.settings import settings
         url = getattr(settings, "redis_cache_url", settings.redis_url.replace("/0", "/2"))
@@ -136,17 +145,57 @@ async def get_cache_redis() -> "aioredis.Redis":
     return _REDIS_CACHE
 
 
+async def get_ratelimit_redis() -> "aioredis.Redis":
+    """Get singleton Redis client for rate limiting (general db).
+
+    Rate limiting runs on every request, so it gets its own pool rather
+    than competing with cache and upload traffic for the general
+    client's 10 connections. The pool blocks briefly when exhausted
+    instead of raising, so load spikes queue instead of looking like a
+    Redis outage.
+
+    Returns:
+        Redis client for rate limiting
+    """
+    global _REDIS_RATELIMIT
+    _drop_inherited_clients()
+    if _REDIS_RATELIMIT is None:
+        try:
+            import redis.asyncio as aioredis
+        except ImportError:
+            raise ImportError("redis is required. Install with: uv add redis")
+
+        from somaai.settings import settings
+
+        host, port, db, password = parse_redis_url(settings.redis_url)
+        pool = aioredis.BlockingConnectionPool(
+            max_connections=RATELIMIT_MAX_CONNECTIONS,
+            timeout=RATELIMIT_POOL_TIMEOUT,
+            host=host,
+            port=port,
+            db=db,
+            password=password or settings.redis_password,
+            decode_responses=True,
+            socket_connect_timeout=5,
+            socket_timeout=5,
+        )
+        logger.info(f"Creating rate limit Redis client: {settings.redis_url}")
+        _REDIS_RATELIMIT = aioredis.Redis(connection_pool=pool)
+    return _REDIS_RATELIMIT
+
+
 async def close_redis_connections() -> None:
     """Close all Redis connections gracefully."""
-    global _REDIS_GENERAL, _REDIS_JOBS, _REDIS_CACHE
+    global _REDIS_GENERAL, _REDIS_JOBS, _REDIS_CACHE, _REDIS_RATELIMIT
 
-    for client in [_REDIS_GENERAL, _REDIS_JOBS, _REDIS_CACHE]:
+    for client in [_REDIS_GENERAL, _REDIS_JOBS, _REDIS_CACHE, _REDIS_RATELIMIT]:
         if client:
             await client.close()
 
     _REDIS_GENERAL = None
     _REDIS_JOBS = None
     _REDIS_CACHE = None
+    _REDIS_RATELIMIT = None
     logger.info("Closed all Redis connections")
 
 
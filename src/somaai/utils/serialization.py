@@ -5,9 +5,17 @@ Provides helpers for JSON serialization, handling types like Decimal.
 
 from __future__ import annotations
 
+import json
 from decimal import Decimal
 from typing import Any
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def json_serializer(obj: Any) -> Any:
     """JSON serializer for objects not serializable by default json code.
@@ -23,3 +31,34 @@ def json_serializer(obj: Any) -> Any:
         # Precision loss is acceptable for output representation
         return float(obj)
     raise TypeError(f"Type {type(obj)} not serializable")
+
+
+def json_dumps(obj: Any) -> bytes | str:
+    """Serialize to JSON, using orjson when installed.
+
+    orjson formats floats natively, which makes large float lists
+    (embeddings) several times faster to encode than stdlib json.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON as bytes (orjson) or str (stdlib fallback)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=json_serializer)
+    return json.dumps(obj, default=json_serializer)
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse JSON, using orjson when installed.
+
+    Args:
+        data: JSON as bytes or str
+
+    Returns:
+        Parsed object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)